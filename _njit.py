@@ -0,0 +1,22 @@
+"""
+Optional Numba JIT
+Shared by the prefilter and simulation kernels: exposes `njit` / `prange`
+that compile with numba when it is installed and degrade to plain Python
+otherwise, so numba stays an optional dependency.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+        return decorator
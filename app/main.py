@@ -5,6 +5,11 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 import random
 
+try:
+    import fcntl
+except ImportError:  # not on Windows; CSV appends are then unlocked
+    fcntl = None
+
 from flask import Flask, jsonify, request, send_file, abort, make_response
 from flask_cors import CORS
 
@@ -91,6 +96,18 @@ app_state: Dict[str, Any] = {
     "metrics": {"trades_today":0,"net_points_today":0.0,"win_rate_trailing20":0.0,"avg_time_to_target_sec":0}
 }
 
+# Serialized /metrics responses, reused until the worker records a new trade
+data_version = 0
+_json_cache: Dict[str, Any] = {}
+
+def cached_json(key: str, build):
+    """JSON response for `key`, serialized at most once per data_version (call under state_lock)."""
+    hit = _json_cache.get(key)
+    if hit is None or hit[0] != data_version:
+        hit = (data_version, jsonify(build()).get_data())
+        _json_cache[key] = hit
+    return app.response_class(hit[1], mimetype=app.json.mimetype)
+
 def clamp(v, lo, hi):
     try:
         x = float(v)
@@ -127,6 +144,15 @@ def ring_append(trades: List[Dict[str, Any]], item: Dict[str, Any], maxlen: int
     if len(trades) > maxlen:
         del trades[maxlen:]
 
+# Line count per memory CSV, so appends don't re-read the file to check the cap.
+# Stored with the file's (size, mtime_ns) when counted: if another gunicorn
+# worker or memory_clear changed the file since, it is counted again.
+_csv_lines: Dict[str, Any] = {}
+
+def _csv_sig(path: str):
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns)
+
 def persist_trade_to_csv(trade: Dict[str, Any]):
     is_win = float(trade.get("pnl_pts") or 0.0) > 0.0
     path = GOLD_CSV if is_win else NEG_CSV
@@ -134,28 +160,52 @@ def persist_trade_to_csv(trade: Dict[str, Any]):
     try:
         import csv
         with open(path, "a", newline="") as f:
+            # Workers share these files: count, append and trim under one lock
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            sig = _csv_sig(path)
+            cached = _csv_lines.get(path)
+            if cached is not None and cached[0] == sig:
+                lines = cached[1]
+            elif sig[0] == 0:
+                lines = 0
+            else:
+                with open(path, "r") as rf:
+                    lines = sum(1 for _ in rf)
             w = csv.DictWriter(f, fieldnames=list(trade.keys()))
             if hdr_needed:
                 w.writeheader()
+                lines += 1
             w.writerow(trade)
-        with open(path, "r") as f:
-            rows = f.readlines()
-        if len(rows) > 1000:
-            with open(path, "w") as f:
-                f.writelines(rows[-1000:])
+            lines += 1
+            f.flush()
+            if lines > 1000:
+                with open(path, "r") as rf:
+                    rows = rf.readlines()
+                with open(path, "w") as wf:
+                    wf.writelines(rows[-1000:])
+                lines = min(len(rows), 1000)
+            _csv_lines[path] = (_csv_sig(path), lines)
     except Exception:
-        pass
+        _csv_lines.pop(path, None)
 
 def recalc_metrics():
     today = datetime.utcnow().date().isoformat()
     trades = app_state["trades"]
-    tday = [t for t in trades if (t.get("timestamp") or "")[:10] == today]
-    net = sum(float(t.get("pnl_pts") or 0.0) for t in tday)
-    last20 = trades[:20]
-    wins = sum(1 for t in last20 if float(t.get("pnl_pts") or 0.0) > 0.0)
-    wr = (wins/len(last20)) if last20 else 0.0
-    avg = int(sum(int(t.get("duration_s") or 0) for t in tday)/len(tday)) if tday else 0
-    app_state["metrics"] = {"trades_today":len(tday),"net_points_today":round(net,2),"win_rate_trailing20":round(wr,3),"avg_time_to_target_sec":avg}
+    n_today, net, dur, wins = 0, 0, 0, 0
+    for i, t in enumerate(trades):
+        get = t.get
+        pnl = float(get("pnl_pts") or 0.0)
+        if i < 20 and pnl > 0.0:
+            wins += 1
+        if (get("timestamp") or "")[:10] == today:
+            n_today += 1
+            net += pnl
+            dur += int(get("duration_s") or 0)
+    n20 = min(len(trades), 20)
+    wr = (wins/n20) if n20 else 0.0
+    avg = int(dur/n_today) if n_today else 0
+    app_state["metrics"] = {"trades_today":n_today,"net_points_today":round(net,2),"win_rate_trailing20":round(wr,3),"avg_time_to_target_sec":avg}
 
 def generate_fake_trade(symbol: str) -> Dict[str, Any]:
     now = datetime.utcnow().isoformat()
@@ -167,6 +217,7 @@ def generate_fake_trade(symbol: str) -> Dict[str, Any]:
     return {"timestamp":now,"symbol":symbol,"direction":direction,"entry_price":entry,"exit_price":exitp,"pnl_pts":pnl,"duration_s":random.randint(10,600),"gpt_score":random.choice([None,85,90,95,99])}
 
 def worker_loop():
+    global data_version
     while not stop_event.is_set():
         with state_lock:
             symbol = app_state["settings"]["symbol"]
@@ -174,6 +225,7 @@ def worker_loop():
         with state_lock:
             ring_append(app_state["trades"], trade, maxlen=50)
             recalc_metrics()
+            data_version += 1
         persist_trade_to_csv(trade)
         if stop_event.wait(5.0):
             break
@@ -190,12 +242,12 @@ def status():
 @app.get("/metrics/summary")
 def metrics_summary():
     with state_lock:
-        return jsonify(app_state["metrics"])
+        return cached_json("metrics", lambda: app_state["metrics"])
 
 @app.get("/metrics/trades")
 def metrics_trades():
     with state_lock:
-        return jsonify(app_state["trades"])
+        return cached_json("trades", lambda: app_state["trades"])
 
 @app.route("/control/start", methods=["POST","OPTIONS"])
 def control_start():
@@ -288,4 +340,5 @@ def memory_clear():
                 os.remove(p)
         except Exception:
             pass
+        _csv_lines.pop(p, None)
     return jsonify({"ok": True})
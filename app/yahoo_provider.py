@@ -67,6 +67,9 @@ class YahooProvider:
 
         max_days = SAFE_LIMITS[interval]["max_days"]
         frames = []
+        # Normalized downloads by period: chunks that map to the same period
+        # (every 1m chunk uses "7d") are trimmed from one fetch, not re-downloaded
+        downloads: Dict[str, pd.DataFrame] = {}
         cur_start = start
         while cur_start < end:
             cur_end = min(cur_start + timedelta(days=max_days), end)
@@ -80,23 +83,13 @@ class YahooProvider:
                 period = f"{min(max_days, max(1, period_days))}d"
 
             try:
-                chunk = yf.download(
-                    symbol,
-                    period=period,
-                    interval=interval,
-                    auto_adjust=False,
-                    progress=False,
-                    threads=False,
-                )
-                if chunk is not None and not chunk.empty:
-                    chunk = chunk.dropna().reset_index()
-                    ts_col = "Datetime" if "Datetime" in chunk.columns else ("Date" if "Date" in chunk.columns else None)
-                    if ts_col:
-                        chunk["timestamp"] = pd.to_datetime(chunk[ts_col])
-                        chunk = chunk[(chunk["timestamp"] >= cur_start) & (chunk["timestamp"] <= cur_end)]
-                        keep = ["timestamp","Open","High","Low","Close","Volume"]
-                        chunk = chunk[[c for c in keep if c in chunk.columns]]
-                        frames.append(chunk)
+                full = downloads.get(period)
+                if full is None:
+                    full = self._download(symbol, period, interval)
+                    downloads[period] = full
+                if not full.empty:
+                    ts = full["timestamp"]
+                    frames.append(full[(ts >= cur_start) & (ts <= cur_end)])
             except Exception:
                 pass
             cur_start = cur_end
@@ -6,7 +6,7 @@ Calculates EMA, RSI, VWAP and other indicators across multiple timeframes.
 import pandas as pd
 import numpy as np
 from datetime import datetime, time
-import pytz
+from zoneinfo import ZoneInfo
 from typing import Dict, Tuple, Optional
 
 
@@ -27,7 +27,7 @@ class TechnicalAnalyzer:
     """
     
     def __init__(self, timezone: str = 'America/Chicago'):
-        self.ct_tz = pytz.timezone(timezone)
+        self.ct_tz = ZoneInfo(timezone)
         
     def calculate_ema(self, df: pd.DataFrame, period: int = 20, column: str = 'Close') -> pd.Series:
         """
@@ -190,15 +190,17 @@ class RateLimiter:
         with self.lock:
             self._check_daily_reset()
             
+            today = datetime.now(timezone.utc).date()
+            
             return {
                 'calls_used': self.calls_used_today,
                 'calls_cap': self.daily_cap,
                 'calls_remaining': max(0, self.daily_cap - self.calls_used_today),
                 'requests_queued': self.request_queue.qsize(),
-                'requests_completed_today': len([
-                    r for r in self.completed_requests 
-                    if r.timestamp.date() == datetime.now(timezone.utc).date()
-                ]),
+                'requests_completed_today': sum(
+                    1 for r in self.completed_requests
+                    if r.timestamp.date() == today
+                ),
                 'is_paused': self.is_paused,
                 'active_request_id': self.active_request.request_id if self.active_request else None
             }
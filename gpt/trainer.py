@@ -247,7 +247,7 @@ Evaluate this candidate and provide your decision in the required JSON format.""
         prefilter_score = candidate_data['candidate'].prefilter_score
         if decision == 'trade' and prefilter_score < self.config['prefilter']['min_score']:
             decision = 'skip'
-            rationale += f" [Gated: prefilter score {prefilter_score} < minimum {self.config['prefilter']['min_score']}]"
+            rationale += f" [Gated: prefilter score {prefilter_score:.2f} < minimum {self.config['prefilter']['min_score']}]"
         
         return GPTDecision(
             decision=decision,
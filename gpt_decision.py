@@ -1,4 +1,4 @@
-import os, time
+import os, time, threading
 from typing import Dict, Any
 
 # OpenAI official sdk v1.x
@@ -8,18 +8,35 @@ except Exception:
     OpenAI = None
 
 RATE_LIMIT_QPS = float(os.environ.get("GPT_RATE_QPS", "0.5"))
+GPT_CONCURRENCY = max(1, int(os.environ.get("GPT_CONCURRENCY", "4")))
 _last_call_ts = 0.0
+_throttle_lock = threading.Lock()
+# Caps in-flight completions across gthread workers
+_gpt_sem = threading.BoundedSemaphore(GPT_CONCURRENCY)
+_client_lock = threading.Lock()
+_client = None
+_client_key = None
 
 class GPTNotConfigured(Exception):
     pass
 
 def _throttle():
     global _last_call_ts
-    dt = time.time() - _last_call_ts
-    min_dt = 1.0 / max(RATE_LIMIT_QPS, 0.01)
-    if dt < min_dt:
-        time.sleep(min_dt - dt)
-    _last_call_ts = time.time()
+    with _throttle_lock:
+        dt = time.time() - _last_call_ts
+        min_dt = 1.0 / max(RATE_LIMIT_QPS, 0.01)
+        if dt < min_dt:
+            time.sleep(min_dt - dt)
+        _last_call_ts = time.time()
+
+def _get_client(api_key: str):
+    # One client (and HTTP connection pool) per key instead of one per call
+    global _client, _client_key
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            _client = OpenAI(api_key=api_key)
+            _client_key = api_key
+        return _client
 
 def decide(signal: str, context: str = "") -> Dict[str, Any]:
     """Calls GPT-3.5/4 via OpenAI SDK and returns a simple decision block.
@@ -31,22 +48,23 @@ def decide(signal: str, context: str = "") -> Dict[str, Any]:
 
     _throttle()
 
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
     prompt = (
         f"You are a trading decision helper. Given a signal '{signal}' and context '{context}', "
         "reply with JSON keys: decision(one of: buy,sell,hold), confidence(0-100), reason(short)."
     )
 
     # Use responses API for structured JSON-ish output
-    resp = client.chat.completions.create(
-        model=os.environ.get("OPENAI_MODEL", "gpt-3.5-turbo"),
-        messages=[
-            {"role": "system", "content": "You output compact JSON only."},
-            {"role": "user", "content": prompt},
-        ],
-        temperature=0.2,
-        max_tokens=100,
-    )
+    with _gpt_sem:
+        resp = client.chat.completions.create(
+            model=os.environ.get("OPENAI_MODEL", "gpt-3.5-turbo"),
+            messages=[
+                {"role": "system", "content": "You output compact JSON only."},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.2,
+            max_tokens=100,
+        )
     text = resp.choices[0].message.content.strip()
 
     # very lenient safety parse
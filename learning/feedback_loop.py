@@ -3,12 +3,18 @@ Feedback Loop System
 Records and processes trade outcomes for learning and adaptation.
 """
 
+import itertools
 import json
+import logging
+import os
+import secrets
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class TradeOutcome(Enum):
     """Trade result categories."""
@@ -93,6 +99,12 @@ class FeedbackLoop:
         self.config = config
         self.trade_records = []
         self.learning_signals = []
+
+        # Trade IDs: session stamp + monotonic counter (no per-trade clock read).
+        # pid + random tag keep instances started in the same second (workers,
+        # restarts, tests) from colliding in the shared stores.
+        self._id_prefix = f"{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}_{secrets.token_hex(3)}"
+        self._trade_seq = itertools.count(1)
         
         # Components for integration
         self.confidence_calibrator = None
@@ -123,7 +135,7 @@ class FeedbackLoop:
             Complete TradeRecord for storage
         """
         # Generate trade ID
-        trade_id = f"trade_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        trade_id = f"trade_{self._id_prefix}_{next(self._trade_seq):06d}"
         
         # Determine outcome category
         outcome = self._categorize_outcome(trade_result)
@@ -260,21 +272,21 @@ class FeedbackLoop:
                 if calibration_event:
                     trade_record.metadata['calibration_event'] = asdict(calibration_event)
             except Exception as e:
-                print(f"Calibrator update error: {e}")
+                logger.warning("Calibrator update error: %s", e)
         
         # Update hard negatives
         if self.hard_negatives and trade_record.result == 'loss':
             try:
                 self.hard_negatives.process_loss(trade_record)
             except Exception as e:
-                print(f"Hard negatives update error: {e}")
+                logger.warning("Hard negatives update error: %s", e)
         
         # Update pattern memory
         if self.pattern_memory:
             try:
                 self.pattern_memory.update_pattern_stats(trade_record)
             except Exception as e:
-                print(f"Pattern memory update error: {e}")
+                logger.warning("Pattern memory update error: %s", e)
     
     def _generate_learning_signal(self, trade_record: TradeRecord) -> Dict:
         """Generate learning signals for system improvement."""
@@ -325,33 +337,48 @@ class FeedbackLoop:
         
         recent_trades = self.trade_records[-lookback_trades:]
         
-        # Basic metrics
+        # Outcome counts, P&L, time and setup breakdown in a single pass
         total_trades = len(recent_trades)
-        wins = sum(1 for t in recent_trades if t.result == 'win')
-        losses = sum(1 for t in recent_trades if t.result == 'loss')
-        timeouts = sum(1 for t in recent_trades if t.result == 'timeout')
+        wins = losses = timeouts = 0
+        total_pnl = gross_profit = gross_loss = 0
+        target_time_sum = target_count = 0
+        setup_stats = {}
+        for trade in recent_trades:
+            result = trade.result
+            pnl = trade.pnl_pts
+            if result == 'win':
+                wins += 1
+            elif result == 'loss':
+                losses += 1
+            elif result == 'timeout':
+                timeouts += 1
+
+            total_pnl += pnl
+            if pnl > 0:
+                gross_profit += pnl
+            elif pnl < 0:
+                gross_loss += pnl
+
+            if trade.time_to_target_sec:
+                target_time_sum += trade.time_to_target_sec
+                target_count += 1
+
+            stats = setup_stats.get(trade.setup_type)
+            if stats is None:
+                stats = setup_stats[trade.setup_type] = {'trades': 0, 'wins': 0, 'pnl': 0}
+            stats['trades'] += 1
+            if result == 'win':
+                stats['wins'] += 1
+            stats['pnl'] += pnl
         
         win_rate = (wins / total_trades) * 100 if total_trades > 0 else 0
         
         # P&L metrics
-        total_pnl = sum(t.pnl_pts for t in recent_trades)
-        avg_win = sum(t.pnl_pts for t in recent_trades if t.pnl_pts > 0) / max(1, wins)
-        avg_loss = sum(t.pnl_pts for t in recent_trades if t.pnl_pts < 0) / max(1, losses)
+        avg_win = gross_profit / max(1, wins)
+        avg_loss = gross_loss / max(1, losses)
         
         # Time metrics
-        target_times = [t.time_to_target_sec for t in recent_trades if t.time_to_target_sec]
-        avg_time_to_target = sum(target_times) / len(target_times) if target_times else 0
-        
-        # Setup breakdown
-        setup_stats = {}
-        for trade in recent_trades:
-            setup = trade.setup_type
-            if setup not in setup_stats:
-                setup_stats[setup] = {'trades': 0, 'wins': 0, 'pnl': 0}
-            setup_stats[setup]['trades'] += 1
-            if trade.result == 'win':
-                setup_stats[setup]['wins'] += 1
-            setup_stats[setup]['pnl'] += trade.pnl_pts
+        avg_time_to_target = target_time_sum / target_count if target_count else 0
         
         # Calculate win rates by setup
         for setup, stats in setup_stats.items():
@@ -1,6 +1,7 @@
 from flask import Flask, jsonify, request, send_file, Response, make_response
 from functools import wraps
 import io, csv, threading, time, os
+import numpy as np
 
 from yahoo_provider import fetch_ohlcv
 from gpt_decision import decide as gpt_decide, GPTNotConfigured
@@ -144,7 +145,12 @@ def live_last():
     df = fetch_ohlcv(symbol, period="1d", interval="1m")
     if df is None or df.empty:
         return jsonify({"ok": False, "error": "No data"}), 404
-    last = df.iloc[-1].to_dict()
+    # Pull scalars per column instead of materializing a row Series; .item()
+    # turns numpy scalars into Python ones (object columns already hold them)
+    last = {}
+    for c in df.columns:
+        v = df[c].iat[-1]
+        last[c] = v.item() if isinstance(v, np.generic) else v
     last["timestamp"] = df.index[-1].isoformat()
     return jsonify({"ok": True, "symbol": symbol, "last": last})
 
@@ -3,17 +3,20 @@ Prefilter Module
 Candidate filtering, scoring, and cost optimization components.
 """
 
-from .session_validator import SessionValidator
+from .session_validator import SessionValidator, SessionResult
 from .confluence_scorer import ConfluenceScorer, SetupType
-from .premium_filter import PremiumFilter, TradingCandidate
+from .premium_filter import PremiumFilter, Thresholds, TradingCandidate, TradingCandidateColumns
 from .cost_optimizer import CostOptimizer, BudgetStatus
 
 __all__ = [
     'SessionValidator',
+    'SessionResult',
     'ConfluenceScorer', 
     'SetupType',
     'PremiumFilter',
+    'Thresholds',
     'TradingCandidate', 
+    'TradingCandidateColumns',
     'CostOptimizer',
     'BudgetStatus'
 ]
@@ -0,0 +1,76 @@
+"""
+Scoring Kernels
+Pure-numeric cores of the confluence scorer, JIT-compiled when numba is available.
+"""
+
+import numpy as np
+from typing import Tuple
+
+from _njit import njit
+
+
+@njit(cache=True)
+def weighted_total(subs: np.ndarray, weights: np.ndarray, min_tenths: int) -> Tuple[int, bool]:
+    """
+    Weighted sum of subscores in fixed-point tenths (0-1000).
+
+    Args:
+        subs: Subscores (0-100) in factor order
+        weights: Factor weights as fractions (summing to 1.0) in the same order
+        min_tenths: Passing threshold in tenths of a point
+
+    Returns:
+        (total score in tenths, passing flag)
+    """
+    tenths = int((subs * weights).sum() * 10.0 + 0.5)
+    return tenths, tenths >= min_tenths
+
+
+@njit(cache=True)
+def compute_score(base_conf: float, ema_code: int, vwap_dist: float, vol_mult: float,
+                  atr: float, atr_lo: float, atr_hi: float, rf_bits: int,
+                  ema_bonus: float, vwap_near_bonus: float,
+                  pen_low_vol: float, pen_weak: float, pen_subopt: float,
+                  pen_far: float, pen_lunch: float, pen_outside: float) -> float:
+    """
+    PremiumFilter prefilter score (0-100): confluence base + bonuses - penalties.
+
+    Args:
+        ema_code: 0 = not aligned, 1 = bullish_aligned, 2 = bearish_aligned
+        rf_bits: Risk factor bitmap (bit0 low_volume, bit1 weak_trend_alignment,
+            bit2 suboptimal_volatility, bit3 far_from_vwap, bit4 lunch_block,
+            bit5 outside_hours)
+    """
+    score = base_conf
+
+    # Bonuses
+    if ema_code != 0:
+        score += ema_bonus
+    if abs(vwap_dist) <= 0.5:
+        score += vwap_near_bonus
+
+    # Light quality shaping
+    if vol_mult > 2.0:
+        score += 1.0
+    if atr_lo <= atr and atr <= atr_hi:
+        score += 0.5
+
+    # Penalties from negatives (stacking, branchless; unset bits subtract 0.0)
+    score -= (rf_bits & 1) * pen_low_vol
+    score -= ((rf_bits >> 1) & 1) * pen_weak
+    score -= ((rf_bits >> 2) & 1) * pen_subopt
+    score -= ((rf_bits >> 3) & 1) * pen_far
+    score -= ((rf_bits >> 4) & 1) * pen_lunch
+    score -= ((rf_bits >> 5) & 1) * pen_outside  # effectively 0
+
+    # Clamp
+    return max(0.0, min(100.0, score))
+
+
+# Prefer the ahead-of-time build (python -m prefilter.build_kernels) when present;
+# keep the source kernel reachable for that build
+compute_score_jit = compute_score
+try:
+    from ._aot_kernels import compute_score  # noqa: F811
+except ImportError:
+    pass
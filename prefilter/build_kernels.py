@@ -0,0 +1,55 @@
+"""
+AOT Kernel Build
+Compiles the prefilter scoring kernel ahead of time with numba.pycc so live
+processes load native code instead of paying the JIT warm-up on first call.
+
+Usage (from the repo root, optional; needs numba and a C compiler):
+    python -m prefilter.build_kernels
+
+Writes prefilter/_aot_kernels.<ext>; _scoring_jit imports it when present and
+falls back to the @njit source otherwise. Without numba, or if compilation
+fails, this is a no-op.
+"""
+
+import os
+import sys
+
+# Same argument order as _scoring_jit.compute_score (ema_code / rf_bits as int64)
+COMPUTE_SCORE_SIG = 'f8(f8,i8,f8,f8,f8,f8,f8,i8,f8,f8,f8,f8,f8,f8,f8,f8)'
+
+
+def build(output_dir: str = None) -> bool:
+    """
+    Build the _aot_kernels extension module.
+
+    Args:
+        output_dir: Where to write the module (default: this package)
+
+    Returns:
+        True if built, False if numba.pycc is unavailable or compilation failed
+    """
+    try:
+        from numba.pycc import CC
+    except Exception:
+        return False
+
+    from prefilter import _scoring_jit
+
+    cc = CC('_aot_kernels')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    # Export the plain Python body so the AOT and JIT paths share one source
+    kernel = getattr(_scoring_jit.compute_score_jit, 'py_func', _scoring_jit.compute_score_jit)
+    cc.export('compute_score', COMPUTE_SCORE_SIG)(kernel)
+    try:
+        cc.compile()
+    except Exception:
+        return False
+    return True
+
+
+if __name__ == '__main__':
+    if build():
+        print("Built prefilter/_aot_kernels")
+    else:
+        print("AOT build skipped (numba.pycc unavailable or compile failed); prefilter kernels stay JIT/pure Python")
+    sys.exit(0)
@@ -6,9 +6,18 @@ Calculates prefilter scores using weighted confluence factors for MES scalping.
 import pandas as pd
 import numpy as np
 from datetime import datetime, time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from enum import Enum
 
+from ._scoring_jit import weighted_total
+from .session_validator import SessionResult
+
+_NAN = float('nan')
+
+# Trend base score indexed by (above_1m << 2) | (above_5m << 1) | above_15m:
+# all agree -> 100, 1m+5m agree -> 75, 1m+15m agree -> 60, 1m alone -> 25
+_TREND_LUT = (100.0, 75.0, 60.0, 25.0, 25.0, 60.0, 75.0, 100.0)
+
 
 class SetupType(Enum):
     """Recognized setup patterns."""
@@ -18,6 +27,11 @@ class SetupType(Enum):
     NONE = "none"
 
 
+# Hot-path setup codes (SetupType stays the public vocabulary)
+_NONE, _ORB, _EMA, _VWAP = range(4)
+_STRUCTURE_SCORES = (0.0, 100.0, 90.0, 85.0)  # indexed by setup code
+
+
 class ConfluenceScorer:
     """
     Calculates confluence scores (0-100) using weighted factors.
@@ -32,6 +46,15 @@ class ConfluenceScorer:
     - Liquidity: 5 (no air gaps)
     - News: 5 (news event proximity)
     """
+
+    # Fixed factor order for the numeric scoring kernel
+    _factor_order = ('trend', 'volume', 'structure', 'atr_band',
+                     'session', 'body_cleanliness', 'liquidity', 'news')
+    _T, _V, _S, _AB, _SE, _BC, _L, _N = range(8)  # subscore slots, same order
+
+    # Indicator keys read by the scorers; normalized to floats with NaN = missing
+    _indicator_keys = ('current_price', '1m_EMA_20', '1m_EMA_20_prev', '5m_EMA_20',
+                       '5m_EMA_20_prev', '15m_EMA_20', '1m_VWAP', 'ATR_5m', '1m_Volume_Multiple')
     
     def __init__(self, config: Dict):
         """
@@ -48,10 +71,26 @@ class ConfluenceScorer:
         total_weight = sum(self.weights.values())
         if abs(total_weight - 100) > 0.1:
             raise ValueError(f"Weights must sum to 100, got {total_weight}")
+
+        # Weights pre-scaled to fractions so scoring is a single dot product
+        self._w = np.fromiter((self.weights[f] / 100.0 for f in self._factor_order),
+                              dtype=np.float64, count=len(self._factor_order))
+        self._min_score = float(config['prefilter']['min_score'])
+        self._min_score_int = int(round(self._min_score * 10))  # fixed-point tenths
+        self._atr_min = float(self.thresholds['atr_min'])
+        self._atr_max = float(self.thresholds['atr_max'])
+        self._min_body_ratio = float(self.thresholds['min_body_ratio'])
+
+        # Piecewise score tables (bucket edges are inclusive lower bounds)
+        self._vol_bins = np.array([1.2, 1.5, 1.8, 2.2])
+        self._vol_scores = np.array([20.0, 40.0, 60.0, 80.0, 100.0])
+        self._atr_sweet_bins = np.array([1.0, np.nextafter(1.5, np.inf)])  # 1.0 <= atr <= 1.5
+        self._atr_sweet_scores = np.array([80.0, 100.0, 80.0])
+        self._liq_scores = np.array([100.0, 70.0, 40.0, 10.0])           # by air gap count
     
     def calculate_score(self, 
                        indicators: Dict,
-                       session_info: Dict,
+                       session_info: Union[SessionResult, Dict],
                        recent_bars: Dict[str, pd.DataFrame],
                        news_status: Dict = None) -> Dict:
         """
@@ -59,52 +98,238 @@ class ConfluenceScorer:
         
         Args:
             indicators: Multi-timeframe indicator values from TechnicalAnalyzer
-            session_info: Session validation info from SessionValidator  
+            session_info: SessionValidator.validate_session() result (or its dict form)
             recent_bars: Dict with '1m', '5m', '15m' recent bar data
             news_status: News event status (optional)
             
         Returns:
             Dict with total score and component subscores
         """
-        subscores = {}
+        subs = np.empty(len(self._factor_order), dtype=np.float64)
+
+        # Normalize indicators once so scorers can use `x != x` as the missing test
+        ind = {}
+        for key in self._indicator_keys:
+            value = indicators.get(key)
+            ind[key] = _NAN if value is None else float(value)
+        indicators = ind
+
+        # One OHLC extract and one summary pass shared by every bar-based scorer
+        bars_1m = recent_bars.get('1m')
+        summary = None
+        if bars_1m is not None:
+            bars_arr = bars_1m[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64, copy=False)
+            summary = self._summarize_bars(bars_arr)
         
         # 1. Trend Score (25 points)
-        subscores['trend'] = self._score_trend(indicators)
+        subs[self._T] = self._score_trend(indicators)
         
         # 2. Volume Score (20 points)  
-        subscores['volume'] = self._score_volume(indicators, recent_bars.get('1m'))
+        subs[self._V] = self._score_volume(indicators, bars_1m)
         
         # 3. Structure Score (20 points)
-        subscores['structure'] = self._score_structure(indicators, recent_bars)
+        subs[self._S] = self._score_structure(indicators, summary)
         
         # 4. ATR Band Score (10 points)
-        subscores['atr_band'] = self._score_atr_band(indicators)
+        subs[self._AB] = self._score_atr_band(indicators)
         
         # 5. Session Score (10 points)
-        subscores['session'] = self._score_session(session_info)
+        subs[self._SE] = self._score_session(session_info)
         
         # 6. Body Cleanliness Score (5 points)
-        subscores['body_cleanliness'] = self._score_body_cleanliness(recent_bars.get('1m'))
+        subs[self._BC] = self._score_body_cleanliness(summary)
         
         # 7. Liquidity Score (5 points)
-        subscores['liquidity'] = self._score_liquidity(recent_bars.get('1m'))
+        subs[self._L] = self._score_liquidity(summary)
         
         # 8. News Score (5 points)  
-        subscores['news'] = self._score_news(news_status)
+        subs[self._N] = self._score_news(news_status)
         
         # Calculate weighted total
-        total_score = sum(
-            subscores[factor] * self.weights[factor] / 100
-            for factor in subscores.keys()
-        )
+        total_int, passing = weighted_total(subs, self._w, self._min_score_int)
         
         return {
-            'total_score': round(total_score, 1),
-            'subscores': subscores,
-            'passing': total_score >= self.config['prefilter']['min_score']
+            'total_score': total_int / 10.0,
+            'subscores': dict(zip(self._factor_order, subs.tolist())),
+            'passing': bool(passing)
         }
+
+    def calculate_scores_batch(self,
+                               indicators_df: pd.DataFrame,
+                               bars_windows: np.ndarray,
+                               session_df: Optional[pd.DataFrame] = None,
+                               news_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Vectorized calculate_score() over many decision points (e.g. a backtest).
+        
+        Args:
+            indicators_df: One row per decision point, columns named like the
+                calculate_score() indicator keys ('current_price', '1m_EMA_20', ...)
+            bars_windows: (N, window, 4) OHLC ndarray - the 1m bars each row
+                would have passed as recent_bars['1m']
+            session_df: Optional 'tradable_now' / 'current_session' columns
+            news_df: Optional 'in_block_window' column
+            
+        Returns:
+            DataFrame (same index) with total_score, each subscore and passing.
+            Missing or NaN indicators score as absent.
+        """
+        n = len(indicators_df)
+        if n == 0:
+            out = pd.DataFrame(np.empty((0, len(self._factor_order))), index=indicators_df.index,
+                               columns=list(self._factor_order))
+            out.insert(0, 'total_score', np.empty(0))
+            out['passing'] = np.empty(0, dtype=bool)
+            return out
+        bars = np.asarray(bars_windows, dtype=np.float64).reshape(n, -1, 4)
+        window = bars.shape[1]
+
+        def col(name: str) -> np.ndarray:
+            if name not in indicators_df.columns:
+                return np.full(n, np.nan)
+            return indicators_df[name].to_numpy(dtype=np.float64)
+
+        price = col('current_price')
+        ema_1m, ema_5m, ema_15m = col('1m_EMA_20'), col('5m_EMA_20'), col('15m_EMA_20')
+        vwap = col('1m_VWAP')
+        subs = np.zeros((n, len(self._factor_order)), dtype=np.float64)
+
+        # 1. Trend
+        above_1m, above_5m, above_15m = price > ema_1m, price > ema_5m, price > ema_15m
+        prev_1m, prev_5m = col('1m_EMA_20_prev'), col('5m_EMA_20_prev')
+        rising_1m = ema_1m > np.where(np.isnan(prev_1m), ema_1m, prev_1m)
+        rising_5m = ema_5m > np.where(np.isnan(prev_5m), ema_5m, prev_5m)
+        trend = np.select(
+            [(above_1m == above_5m) & (above_5m == above_15m), above_1m == above_5m, above_1m == above_15m],
+            [100.0, 75.0, 60.0], 25.0
+        )
+        slope_ok = (rising_1m == above_1m) & (rising_5m == above_5m)
+        trend = np.where(slope_ok, np.minimum(100.0, trend + 15.0), trend)
+        has_trend = ~np.isnan(np.stack([price, ema_1m, ema_5m, ema_15m])).any(axis=0)
+        subs[:, self._T] = np.where(has_trend, trend, 0.0)
+
+        # 2. Volume
+        vm = col('1m_Volume_Multiple')
+        vm_scores = self._vol_scores[np.searchsorted(self._vol_bins, np.nan_to_num(vm), side='right')]
+        subs[:, self._V] = np.where(np.isnan(vm), 0.0, vm_scores)
+
+        # 3. Structure
+        if window >= 10:
+            levels = np.stack([price, ema_1m, vwap])
+            has_levels = (~np.isnan(levels) & (levels != 0)).all(axis=0)
+            recent_closes = bars[:, -5:, 3]
+            if window >= 20:
+                orb_high = bars[:, :10, 1].max(axis=1)
+                orb_low = bars[:, :10, 2].min(axis=1)
+                had_breakout = ((bars[:, -10:, 1].max(axis=1) > orb_high + 0.5)
+                                | (bars[:, -10:, 2].min(axis=1) < orb_low - 0.5))
+                is_orb = had_breakout & ((np.abs(price - orb_high) < 1.0) | (np.abs(price - orb_low) < 1.0))
+            else:
+                is_orb = np.zeros(n, dtype=bool)
+            is_ema = (np.abs(price - ema_1m) < 1.0) & (np.abs(recent_closes - ema_1m[:, None]).min(axis=1) < 0.5)
+            is_vwap = (np.abs(recent_closes - vwap[:, None]).min(axis=1) < 0.5) & (np.abs(price - vwap) > 0.5)
+            structure = np.select([is_orb, is_ema, is_vwap], [100.0, 90.0, 85.0], 0.0)
+            subs[:, self._S] = np.where(has_levels, structure, 0.0)
+
+        # 4. ATR band
+        atr = col('ATR_5m')
+        min_atr = self._atr_min
+        max_atr = self._atr_max
+        atr_f = np.nan_to_num(atr)
+        in_band = self._atr_sweet_scores[np.searchsorted(self._atr_sweet_bins, atr_f, side='right')]
+        too_low = np.maximum(0.0, (atr_f / min_atr) * 60.0)
+        too_high = np.maximum(0.0, 60.0 - np.minimum(60.0, (atr_f - max_atr) * 30.0))
+        atr_score = np.select([(atr_f >= min_atr) & (atr_f <= max_atr), atr_f < min_atr], [in_band, too_low], too_high)
+        subs[:, self._AB] = np.where(np.isnan(atr), 0.0, atr_score)
+
+        # 5. Session
+        if session_df is not None and 'tradable_now' in session_df.columns:
+            tradable = session_df['tradable_now'].fillna(False).to_numpy(dtype=bool)
+            current = (session_df['current_session'].to_numpy(dtype=object)
+                       if 'current_session' in session_df.columns else np.full(n, '', dtype=object))
+            subs[:, self._SE] = np.select([tradable & (current == 'rth_a'), tradable & (current == 'rth_b')], [100.0, 90.0], 0.0)
+
+        # 6. Body cleanliness
+        if window >= 5:
+            last5 = bars[:, -5:]
+            total_range = last5[:, :, 1] - last5[:, :, 2]
+            body_size = np.abs(last5[:, :, 3] - last5[:, :, 0])
+            valid = total_range > 0
+            ratios = np.where(valid, body_size / np.where(valid, total_range, 1.0), 0.0)
+            counts = valid.sum(axis=1)
+            avg_ratio = ratios.sum(axis=1) / np.maximum(counts, 1)
+            min_ratio = self._min_body_ratio
+            body = np.where(avg_ratio >= min_ratio,
+                            60.0 + (avg_ratio - min_ratio) / (1.0 - min_ratio) * 40.0,
+                            (avg_ratio / min_ratio) * 60.0)
+            subs[:, self._BC] = np.where(counts > 0, body, 0.0)
+
+        # 7. Liquidity
+        if window >= 10:
+            ranges = bars[:, -10:, 1] - bars[:, -10:, 2]
+            air_gaps = np.count_nonzero(ranges > 2.0 * ranges.mean(axis=1, keepdims=True), axis=1)
+            subs[:, self._L] = self._liq_scores[np.minimum(air_gaps, 3)]
+        else:
+            subs[:, self._L] = 50.0
+
+        # 8. News
+        if news_df is not None and 'in_block_window' in news_df.columns:
+            subs[:, self._N] = np.where(news_df['in_block_window'].fillna(False).to_numpy(dtype=bool), 0.0, 100.0)
+        else:
+            subs[:, self._N] = 100.0
+
+        total_int = np.floor(subs @ self._w * 10.0 + 0.5).astype(np.int64)
+        out = pd.DataFrame(subs, index=indicators_df.index, columns=list(self._factor_order))
+        out.insert(0, 'total_score', total_int / 10.0)
+        out['passing'] = total_int >= self._min_score_int
+        return out
     
-    def _score_trend(self, indicators: Dict) -> float:
+    def _summarize_bars(self, bars_arr: np.ndarray) -> Dict:
+        """
+        Reduce the 1m window to what the bar-based scorers need, in one pass.
+        
+        Args:
+            bars_arr: 1m OHLC ndarray (cols: O, H, L, C)
+            
+        Returns:
+            Dict with 'n' plus whichever of 'recent_closes', 'avg_body_ratio'
+            (last 5), 'air_gaps', 'recent_high', 'recent_low' (last 10) and
+            'orb_high', 'orb_low' (first 10) the window is long enough for
+        """
+        n = len(bars_arr)
+        summary = {'n': n}
+        if n < 5:
+            return summary
+
+        tail = bars_arr[-10:]
+        ranges = tail[:, 1] - tail[:, 2]
+        summary['recent_closes'] = tail[-5:, 3]
+
+        # Body ratio over the last 5 bars, skipping zero-range bars (dojis)
+        last5 = tail[-5:]
+        range5 = ranges[-5:]
+        valid = range5 > 0
+        if valid.any():
+            body5 = np.abs(last5[:, 3] - last5[:, 0])
+            summary['avg_body_ratio'] = float((body5[valid] / range5[valid]).mean())
+
+        if n < 10:
+            return summary
+
+        # Air gaps = ranges > 2x the 10-bar average
+        summary['air_gaps'] = int(np.count_nonzero(ranges > 2.0 * ranges.mean()))
+        summary['recent_high'] = float(tail[:, 1].max())
+        summary['recent_low'] = float(tail[:, 2].min())
+
+        if n >= 20:
+            # Opening range (first 5-10 minutes)
+            summary['orb_high'] = float(bars_arr[:10, 1].max())
+            summary['orb_low'] = float(bars_arr[:10, 2].min())
+
+        return summary
+
+    @staticmethod
+    def _score_trend(indicators: Dict) -> float:
         """
         Score trend alignment across timeframes (0-100).
         
@@ -112,42 +337,30 @@ class ConfluenceScorer:
         Good score: 1m+5m aligned, 15m neutral/aligned  
         Poor score: Mixed signals or choppy
         """
-        if not all(key in indicators for key in ['1m_EMA_20', '5m_EMA_20', '15m_EMA_20', 'current_price']):
+        current_price = indicators.get('current_price', _NAN)
+        ema_1m = indicators.get('1m_EMA_20', _NAN)
+        ema_5m = indicators.get('5m_EMA_20', _NAN)
+        ema_15m = indicators.get('15m_EMA_20', _NAN)
+        if current_price != current_price or ema_1m != ema_1m or ema_5m != ema_5m or ema_15m != ema_15m:
             return 0.0
         
-        current_price = indicators['current_price']
-        ema_1m = indicators['1m_EMA_20']
-        ema_5m = indicators['5m_EMA_20'] 
-        ema_15m = indicators['15m_EMA_20']
-        
         # Determine price position relative to each EMA
         above_1m = current_price > ema_1m
         above_5m = current_price > ema_5m
         above_15m = current_price > ema_15m
         
         # Check EMA slope alignment (simplified)
-        ema_1m_rising = ema_1m > indicators.get('1m_EMA_20_prev', ema_1m)
-        ema_5m_rising = ema_5m > indicators.get('5m_EMA_20_prev', ema_5m)
-        
-        # Score based on alignment
-        if above_1m == above_5m == above_15m:
-            # Perfect alignment - all timeframes agree
-            base_score = 100
-        elif above_1m == above_5m:
-            # 1m and 5m aligned, 15m different
-            base_score = 75
-        elif above_1m == above_15m:
-            # 1m and 15m aligned, 5m different  
-            base_score = 60
-        else:
-            # Mixed signals
-            base_score = 25
+        ema_1m_prev = indicators.get('1m_EMA_20_prev', _NAN)
+        ema_5m_prev = indicators.get('5m_EMA_20_prev', _NAN)
+        ema_1m_rising = ema_1m_prev == ema_1m_prev and ema_1m > ema_1m_prev
+        ema_5m_rising = ema_5m_prev == ema_5m_prev and ema_5m > ema_5m_prev
         
-        # Bonus for slope alignment
-        if ema_1m_rising == above_1m and ema_5m_rising == above_5m:
-            base_score = min(100, base_score + 15)
+        # Score based on alignment (see _TREND_LUT)
+        base_score = _TREND_LUT[(above_1m << 2) | (above_5m << 1) | above_15m]
         
-        return float(base_score)
+        # Bonus for slope alignment
+        slope_aligned = (ema_1m_rising == above_1m) & (ema_5m_rising == above_5m)
+        return min(100.0, base_score + 15.0 * slope_aligned)
     
     def _score_volume(self, indicators: Dict, bars_1m: Optional[pd.DataFrame]) -> float:
         """
@@ -158,22 +371,13 @@ class ConfluenceScorer:
         Average: 1.5x-1.8x
         Poor: <1.5x
         """
-        volume_multiple = indicators.get('1m_Volume_Multiple')
-        if volume_multiple is None or pd.isna(volume_multiple):
+        volume_multiple = indicators.get('1m_Volume_Multiple', _NAN)
+        if volume_multiple != volume_multiple:
             return 0.0
         
-        if volume_multiple >= 2.2:
-            return 100.0
-        elif volume_multiple >= 1.8:
-            return 80.0
-        elif volume_multiple >= 1.5:
-            return 60.0
-        elif volume_multiple >= 1.2:
-            return 40.0
-        else:
-            return 20.0
+        return float(self._vol_scores[np.searchsorted(self._vol_bins, volume_multiple, side='right')])
     
-    def _score_structure(self, indicators: Dict, recent_bars: Dict[str, pd.DataFrame]) -> float:
+    def _score_structure(self, indicators: Dict, summary: Optional[Dict]) -> float:
         """
         Score setup structure recognition (0-100).
         
@@ -182,67 +386,60 @@ class ConfluenceScorer:
         - 20EMA pullback  
         - VWAP rejection
         """
-        setup_type = self._identify_setup(indicators, recent_bars)
-        
-        if setup_type == SetupType.ORB_RETEST_GO:
-            return 100.0
-        elif setup_type == SetupType.EMA_PULLBACK:
-            return 90.0
-        elif setup_type == SetupType.VWAP_REJECTION:
-            return 85.0
-        else:
-            return 0.0  # No valid setup identified
+        # 0.0 when no valid setup is identified
+        return _STRUCTURE_SCORES[self._identify_setup(indicators, summary)]
     
-    def _identify_setup(self, indicators: Dict, recent_bars: Dict[str, pd.DataFrame]) -> SetupType:
+    def _identify_setup(self, indicators: Dict, summary: Optional[Dict]) -> int:
         """
         Identify the current setup pattern.
         
+        Args:
+            indicators: Multi-timeframe indicator values
+            summary: 1m window summary from _summarize_bars()
+            
         Returns:
-            SetupType enum value
+            Setup code: _ORB, _EMA, _VWAP or _NONE
         """
-        bars_1m = recent_bars.get('1m')
-        if bars_1m is None or len(bars_1m) < 10:
-            return SetupType.NONE
-        
-        current_price = indicators.get('current_price')
-        ema_20 = indicators.get('1m_EMA_20')
-        vwap = indicators.get('1m_VWAP')
-        
-        if not all([current_price, ema_20, vwap]):
-            return SetupType.NONE
-        
-        # Get recent price action
-        recent_highs = bars_1m['High'].tail(10)
-        recent_lows = bars_1m['Low'].tail(10)
-        recent_closes = bars_1m['Close'].tail(5)
+        if summary is None or summary['n'] < 10:
+            return _NONE
+        
+        current_price = indicators.get('current_price', _NAN)
+        ema_20 = indicators.get('1m_EMA_20', _NAN)
+        vwap = indicators.get('1m_VWAP', _NAN)
+        
+        # Missing (NaN) or zero levels mean no setup can be identified
+        if not (current_price == current_price and ema_20 == ema_20 and vwap == vwap):
+            return _NONE
+        if not (current_price and ema_20 and vwap):
+            return _NONE
+
+        recent_closes = summary['recent_closes']
         
         # ORB Retest-Go: Price broke opening range, pulled back, now retesting breakout
-        if self._is_orb_retest_pattern(bars_1m, current_price):
-            return SetupType.ORB_RETEST_GO
+        if self._is_orb_retest_pattern(summary, current_price):
+            return _ORB
         
         # 20EMA Pullback: Price pulled back to EMA and bouncing
-        elif self._is_ema_pullback_pattern(current_price, ema_20, recent_closes):
-            return SetupType.EMA_PULLBACK
+        if self._is_ema_pullback_pattern(current_price, ema_20, recent_closes):
+            return _EMA
         
         # VWAP Rejection: Price tested VWAP and rejected
-        elif self._is_vwap_rejection_pattern(current_price, vwap, recent_closes):
-            return SetupType.VWAP_REJECTION
+        if self._is_vwap_rejection_pattern(current_price, vwap, recent_closes):
+            return _VWAP
         
-        return SetupType.NONE
+        return _NONE
     
-    def _is_orb_retest_pattern(self, bars_1m: pd.DataFrame, current_price: float) -> bool:
+    @staticmethod
+    def _is_orb_retest_pattern(summary: Dict, current_price: float) -> bool:
         """Check for ORB retest-go pattern."""
-        if len(bars_1m) < 20:
+        if summary['n'] < 20:
             return False
         
-        # Define opening range (first 5-10 minutes)
-        opening_bars = bars_1m.head(10)
-        orb_high = opening_bars['High'].max()
-        orb_low = opening_bars['Low'].min()
+        orb_high = summary['orb_high']
+        orb_low = summary['orb_low']
         
         # Check if we've had a breakout and retest
-        recent_bars = bars_1m.tail(10)
-        had_breakout = (recent_bars['High'].max() > orb_high + 0.5) or (recent_bars['Low'].min() < orb_low - 0.5)
+        had_breakout = (summary['recent_high'] > orb_high + 0.5) or (summary['recent_low'] < orb_low - 0.5)
         
         # Check if current price is near breakout level
         near_orb_high = abs(current_price - orb_high) < 1.0
@@ -250,24 +447,24 @@ class ConfluenceScorer:
         
         return had_breakout and (near_orb_high or near_orb_low)
     
-    def _is_ema_pullback_pattern(self, current_price: float, ema_20: float, recent_closes: pd.Series) -> bool:
+    def _is_ema_pullback_pattern(self, current_price: float, ema_20: float, recent_closes: np.ndarray) -> bool:
         """Check for 20EMA pullback pattern."""
         # Price should be near EMA
         distance_to_ema = abs(current_price - ema_20)
         near_ema = distance_to_ema < 1.0
         
         # Should have recent pullback to EMA
-        touched_ema = any(abs(close - ema_20) < 0.5 for close in recent_closes)
+        touched_ema = bool(np.abs(recent_closes - ema_20).min() < 0.5)
         
         return near_ema and touched_ema
     
-    def _is_vwap_rejection_pattern(self, current_price: float, vwap: float, recent_closes: pd.Series) -> bool:
+    def _is_vwap_rejection_pattern(self, current_price: float, vwap: float, recent_closes: np.ndarray) -> bool:
         """Check for VWAP rejection pattern."""
         # Price should be moving away from VWAP after test
         distance_to_vwap = abs(current_price - vwap)
         
         # Should have recently tested VWAP
-        tested_vwap = any(abs(close - vwap) < 0.5 for close in recent_closes)
+        tested_vwap = bool(np.abs(recent_closes - vwap).min() < 0.5)
         
         # Now moving away
         moving_away = distance_to_vwap > 0.5
@@ -282,19 +479,16 @@ class ConfluenceScorer:
         Too low: <0.8 (insufficient movement)
         Too high: >2.0 (too volatile)
         """
-        atr_5m = indicators.get('ATR_5m')
-        if atr_5m is None or pd.isna(atr_5m):
+        atr_5m = indicators.get('ATR_5m', _NAN)
+        if atr_5m != atr_5m:
             return 0.0
         
-        min_atr = self.thresholds['atr_min']
-        max_atr = self.thresholds['atr_max']
+        min_atr = self._atr_min
+        max_atr = self._atr_max
         
         if min_atr <= atr_5m <= max_atr:
-            # Within optimal range - score based on position in range
-            if 1.0 <= atr_5m <= 1.5:
-                return 100.0  # Sweet spot
-            else:
-                return 80.0   # Good but not perfect
+            # Within optimal range - 100 in the 1.0-1.5 sweet spot, else 80
+            return float(self._atr_sweet_scores[np.searchsorted(self._atr_sweet_bins, atr_5m, side='right')])
         elif atr_5m < min_atr:
             # Too low - scale from 0 to 60
             return max(0.0, (atr_5m / min_atr) * 60.0)
@@ -304,17 +498,23 @@ class ConfluenceScorer:
             penalty = min(60.0, excess * 30.0)
             return max(0.0, 60.0 - penalty)
     
-    def _score_session(self, session_info: Dict) -> float:
+    @staticmethod
+    def _score_session(session_info: Union[SessionResult, Dict]) -> float:
         """
         Score trading session validity (0-100).
         
         Perfect: In RTH A or RTH B
         Zero: Weekend, holiday, or lunch block
         """
-        if not session_info.get('tradable_now', False):
-            return 0.0
+        if isinstance(session_info, SessionResult):
+            tradable_now = session_info.tradable_now
+            current_session = session_info.current_session
+        else:
+            tradable_now = session_info.get('tradable_now', False)
+            current_session = session_info.get('current_session', '')
         
-        current_session = session_info.get('current_session', '')
+        if not tradable_now:
+            return 0.0
         
         if current_session == 'rth_a':
             return 100.0  # Morning session preferred
@@ -323,33 +523,19 @@ class ConfluenceScorer:
         else:
             return 0.0    # Outside trading hours
     
-    def _score_body_cleanliness(self, bars_1m: Optional[pd.DataFrame]) -> float:
+    def _score_body_cleanliness(self, summary: Optional[Dict]) -> float:
         """
         Score price action cleanliness (0-100).
         
         Clean: Real bodies are ≥35% of total range
         Measures last 5 bars for recent clean action
         """
-        if bars_1m is None or len(bars_1m) < 5:
+        # Absent when there are <5 bars or all of them are zero-range
+        avg_body_ratio = summary.get('avg_body_ratio') if summary is not None else None
+        if avg_body_ratio is None:
             return 0.0
-        
-        recent_bars = bars_1m.tail(5)
-        body_ratios = []
-        
-        for _, bar in recent_bars.iterrows():
-            total_range = bar['High'] - bar['Low']
-            if total_range <= 0:
-                continue
-                
-            body_size = abs(bar['Close'] - bar['Open'])
-            body_ratio = body_size / total_range
-            body_ratios.append(body_ratio)
-        
-        if not body_ratios:
-            return 0.0
-        
-        avg_body_ratio = sum(body_ratios) / len(body_ratios)
-        min_ratio = self.thresholds['min_body_ratio']
+
+        min_ratio = self._min_body_ratio
         
         if avg_body_ratio >= min_ratio:
             # Scale from min_ratio to 1.0 → 60 to 100 points
@@ -359,32 +545,20 @@ class ConfluenceScorer:
             # Scale from 0 to min_ratio → 0 to 60 points
             return (avg_body_ratio / min_ratio) * 60.0
     
-    def _score_liquidity(self, bars_1m: Optional[pd.DataFrame]) -> float:
+    def _score_liquidity(self, summary: Optional[Dict]) -> float:
         """
         Score liquidity - no air gaps in recent price action (0-100).
         
         Air gaps = bars with abnormally wide spreads relative to ATR
         """
-        if bars_1m is None or len(bars_1m) < 10:
+        if summary is None or summary['n'] < 10:
             return 50.0  # Neutral if insufficient data
         
-        recent_bars = bars_1m.tail(10)
-        ranges = recent_bars['High'] - recent_bars['Low']
-        avg_range = ranges.mean()
-        
-        # Check for air gaps (ranges > 2x average)
-        air_gaps = sum(1 for r in ranges if r > 2.0 * avg_range)
-        
-        if air_gaps == 0:
-            return 100.0
-        elif air_gaps == 1:
-            return 70.0
-        elif air_gaps == 2:
-            return 40.0
-        else:
-            return 10.0
+        # Air gaps (ranges > 2x average) counted by _summarize_bars()
+        return float(self._liq_scores[min(summary['air_gaps'], 3)])
     
-    def _score_news(self, news_status: Optional[Dict]) -> float:
+    @staticmethod
+    def _score_news(news_status: Optional[Dict]) -> float:
         """
         Score news event proximity (0-100).
         
@@ -6,19 +6,25 @@ Cost Optimizer
 """
 
 from __future__ import annotations
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from typing import Deque, Dict, Iterable, Tuple, Optional
 from enum import Enum
 from datetime import datetime, timezone
 
 
+# Risk flags that count double toward risky_max_allowed_flags
+_SEVERE_FLAGS = frozenset({"lunch_block", "outside_hours"})
+
+
 class BudgetStatus(str, Enum):
     OK = "ok"
     PAUSED = "paused"
     EXCEEDED = "exceeded"
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetState:
     daily_cap: int
     used_today: int = 0
@@ -44,8 +50,18 @@ class CostOptimizer:
           session_losses: 2
     """
 
+    __slots__ = (
+        "config", "state", "min_score", "risky_max_allowed_flags",
+        "trigger_recent_gpt_passes", "trigger_session_losses",
+        "recent_gpt_passes", "session_losses", "_today_cache",
+    )
+
+    # How long a formatted UTC date is reused before re-reading the clock
+    _TODAY_TTL_SEC = 30.0
+
     def __init__(self, config: Dict):
         self.config = config or {}
+        self._today_cache = (float("-inf"), "")  # (monotonic ts, "YYYY-MM-DD")
         gpt_cfg = (self.config.get("gpt", {}) or {})
         self.state = BudgetState(
             daily_cap=int(gpt_cfg.get("daily_call_cap", 500)),
@@ -65,7 +81,8 @@ class CostOptimizer:
         self.trigger_session_losses = int(em.get("session_losses", 2))
 
         # rolling trackers
-        self.recent_gpt_passes: List[str] = []  # store candidate IDs/summaries passed to GPT
+        # last N candidate IDs/summaries passed to GPT (N = trigger_recent_gpt_passes)
+        self.recent_gpt_passes: Deque[str] = deque(maxlen=self.trigger_recent_gpt_passes)
         self.session_losses = 0                 # reset per session if you call reset_session()
 
     # ---------- Public API ----------
@@ -84,7 +101,15 @@ class CostOptimizer:
         """
         Decide whether to call GPT for this candidate.
         Returns (allow, reason).
+
+        Gates run cheapest-first; the day reset stays ahead of the pause
+        check so a new UTC day still clears yesterday's pause.
         """
+        # Candidate quality gate (stateless, cheapest)
+        score = float(getattr(candidate, "prefilter_score", 0.0))
+        if score < self.min_score:
+            return (False, "below_min_score")
+
         self._maybe_reset_day()
 
         if self.state.paused:
@@ -102,14 +127,8 @@ class CostOptimizer:
             self.state.paused_reason = "emergency_pause_recent_passes_and_losses"
             return (False, "emergency_pause")
 
-        # Candidate quality gates
-        score = float(getattr(candidate, "prefilter_score", 0.0))
-        if score < self.min_score:
-            return (False, "below_min_score")
-
         # Negative hooks: too many red flags → skip GPT
-        risk_factors = list(getattr(candidate, "risk_factors", []) or [])
-        if self._is_overly_risky(risk_factors):
+        if self._is_overly_risky(getattr(candidate, "risk_factors", ()) or ()):
             return (False, "too_many_risks")
 
         # All clear
@@ -119,10 +138,7 @@ class CostOptimizer:
         """Increment usage and rolling pass list when GPT is actually called."""
         self._maybe_reset_day()
         self.state.used_today += 1
-        self.recent_gpt_passes.append(candidate_id)
-        # keep last N = trigger_recent_gpt_passes
-        if len(self.recent_gpt_passes) > self.trigger_recent_gpt_passes:
-            self.recent_gpt_passes = self.recent_gpt_passes[-self.trigger_recent_gpt_passes:]
+        self.recent_gpt_passes.append(candidate_id)  # bounded deque keeps the last N
 
     def get_status(self) -> Dict:
         """Expose current budget status for API/metrics."""
@@ -142,17 +158,13 @@ class CostOptimizer:
 
     # ---------- Internals ----------
 
-    def _is_overly_risky(self, risk_factors: List[str]) -> bool:
+    def _is_overly_risky(self, risk_factors: Iterable[str]) -> bool:
         """
         If risk flags exceed the allowed count, skip GPT to save budget.
         Example flags: low_volume, weak_trend_alignment, suboptimal_volatility, far_from_vwap, lunch_block
         """
-        # Count severe/non-severe; you can tune this weighting if desired.
-        severe = {"lunch_block", "outside_hours"}
-        count = 0
-        for r in risk_factors:
-            count += 2 if r in severe else 1
-        return count > self.risky_max_allowed_flags
+        # Count severe/non-severe; you can tune this weighting via _SEVERE_FLAGS.
+        return sum(2 if r in _SEVERE_FLAGS else 1 for r in risk_factors) > self.risky_max_allowed_flags
 
     def _maybe_reset_day(self):
         today = self._today_str()
@@ -164,6 +176,11 @@ class CostOptimizer:
             self.recent_gpt_passes.clear()
             # Note: session_losses stays as-is; call reset_session() when the market session changes.
 
-    @staticmethod
-    def _today_str() -> str:
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    def _today_str(self) -> str:
+        now = time.monotonic()
+        ts, today = self._today_cache
+        if now - ts < self._TODAY_TTL_SEC:
+            return today
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        self._today_cache = (now, today)
+        return today
@@ -7,12 +7,31 @@ Premium Filter
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except Exception:
+    pa = None
 
 from .session_validator import SessionValidator
 from .confluence_scorer import ConfluenceScorer, SetupType
+from ._scoring_jit import compute_score
+
+# Risk factor bits (see compute_score); names are the risk_factors strings
+RF_LOW_VOL = 1        # low_volume
+RF_WEAK = 2           # weak_trend_alignment
+RF_SUBOPT = 4         # suboptimal_volatility
+RF_FAR = 8            # far_from_vwap
+RF_LUNCH = 16         # lunch_block
+RF_OUTSIDE = 32       # outside_hours
+
+# Integer code handed to the compute_score kernel
+_EMA_CODES = {"bullish_aligned": 1, "bearish_aligned": 2}  # anything else -> 0
 
 
 @dataclass
@@ -40,6 +59,134 @@ class TradingCandidate:
     risk_factors: List[str] = field(default_factory=list)
 
 
+def _object_column(values: Iterable) -> np.ndarray:
+    """1-D object array (never 2-D, even for equal-length list values)."""
+    values = list(values)
+    col = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        col[i] = v
+    return col
+
+
+def _empty_object() -> np.ndarray:
+    return np.empty(0, dtype=object)
+
+
+def _empty_float() -> np.ndarray:
+    return np.empty(0, dtype=np.float64)
+
+
+@dataclass
+class TradingCandidateColumns:
+    """
+    Struct-of-arrays store of TradingCandidates for batch scoring.
+    One array per TradingCandidate field (numeric fields as float64, the rest
+    as object), plus source_index: each row's position in the evaluated batch.
+    Use view(i) to get a single TradingCandidate back.
+    """
+    symbol: np.ndarray = field(default_factory=_empty_object)
+    setup_type: np.ndarray = field(default_factory=_empty_object)
+    direction: np.ndarray = field(default_factory=_empty_object)
+    timestamp: np.ndarray = field(default_factory=_empty_object)
+    session_label: np.ndarray = field(default_factory=_empty_object)
+    market_regime: np.ndarray = field(default_factory=_empty_object)
+    prefilter_score: np.ndarray = field(default_factory=_empty_float)
+    confluence_factors: np.ndarray = field(default_factory=_empty_object)
+    ema_alignment: np.ndarray = field(default_factory=_empty_object)
+    volume_multiple: np.ndarray = field(default_factory=_empty_float)
+    atr_5m: np.ndarray = field(default_factory=_empty_float)
+    vwap_distance: np.ndarray = field(default_factory=_empty_float)
+    wickiness: np.ndarray = field(default_factory=_empty_float)
+    risk_factors: np.ndarray = field(default_factory=_empty_object)
+    source_index: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    length: int = 0
+
+    @classmethod
+    def column_names(cls) -> Tuple[str, ...]:
+        return tuple(f.name for f in fields(cls) if f.name != "length")
+
+    def __len__(self) -> int:
+        return self.length
+
+    def append_bulk(self, **columns) -> None:
+        """Append rows given one equal-length array/sequence per column."""
+        names = self.column_names()
+        missing = [name for name in names if name not in columns]
+        if missing:
+            raise ValueError(f"append_bulk missing columns: {missing}")
+        n = len(columns[names[0]])
+        for name in names:
+            current = getattr(self, name)
+            if current.dtype == object:
+                new = _object_column(columns[name])
+            else:
+                new = np.asarray(columns[name], dtype=current.dtype)
+            if len(new) != n:
+                raise ValueError(f"append_bulk column {name!r} has {len(new)} rows, expected {n}")
+            setattr(self, name, new if self.length == 0 else np.concatenate((current, new)))
+        self.length += n
+
+    def view(self, i: int) -> TradingCandidate:
+        """Materialize row i as a TradingCandidate."""
+        return TradingCandidate(
+            symbol=self.symbol[i],
+            setup_type=self.setup_type[i],
+            direction=self.direction[i],
+            timestamp=self.timestamp[i],
+            session_label=self.session_label[i],
+            market_regime=self.market_regime[i],
+            prefilter_score=float(self.prefilter_score[i]),
+            confluence_factors=self.confluence_factors[i],
+            ema_alignment=self.ema_alignment[i],
+            volume_multiple=float(self.volume_multiple[i]),
+            atr_5m=float(self.atr_5m[i]),
+            vwap_distance=float(self.vwap_distance[i]),
+            wickiness=float(self.wickiness[i]),
+            risk_factors=self.risk_factors[i]
+        )
+
+    def to_arrow(self):
+        """Export as a pyarrow.Table (numeric columns are not copied)."""
+        if pa is None:
+            raise ImportError("pyarrow is required for TradingCandidateColumns.to_arrow()")
+        return pa.table({name: getattr(self, name) for name in self.column_names()})
+
+
+@dataclass(slots=True, frozen=True)
+class Thresholds:
+    """PremiumFilter thresholds, bonuses and penalties (prefilter config section)."""
+    min_score: float = 70.0
+    max_vwap_abs: float = 2.0                 # far from VWAP → risky
+    min_volume_mult: float = 1.2              # < 1.2x volume → low_volume
+    atr_range: Tuple[float, float] = (0.6, 2.2)  # outside → suboptimal_volatility
+    event_block_tags: frozenset = frozenset({"FOMC", "CPI", "NFP"})
+
+    # Bonuses/Penalties
+    ema_bonus: float = 2.0
+    vwap_near_bonus: float = 1.0
+    penalty_low_volume: float = 2.0
+    penalty_weak_trend: float = 1.5
+    penalty_suboptimal_vol: float = 1.0
+    penalty_far_vwap: float = 1.0
+    penalty_lunch: float = 3.0
+    penalty_outside_hours: float = 99.0       # auto-kill
+
+    @classmethod
+    def from_config(cls, th: Dict) -> Thresholds:
+        """Build from the prefilter config dict; missing keys keep the defaults."""
+        return cls(**{f.name: cls.coerce(f.name, th[f.name]) for f in fields(cls) if f.name in th})
+
+    @staticmethod
+    def coerce(name: str, value):
+        """Convert a config value to the type of field `name`."""
+        if name == "atr_range":
+            lo, hi = value
+            return (float(lo), float(hi))
+        if name == "event_block_tags":
+            return frozenset(value)
+        return float(value)
+
+
 class PremiumFilter:
     """
     Builds a TradingCandidate from raw feature blobs.
@@ -58,24 +205,121 @@ class PremiumFilter:
         self.config = config or {}
         self.validator = session_validator
         self.scorer = confluence_scorer
+        self._setup_lookup: Dict[str, SetupType] = dict(SetupType.__members__)
+
+        # Thresholds, bonuses and penalties
+        self.t = Thresholds.from_config(self.config.get("prefilter", {}) or {})
+
+    # ---------- Threshold attributes ----------
+    # min_score, atr_range, ... predate Thresholds; each reads self.t and
+    # assigning one rebuilds self.t with that field replaced
+
+    @property
+    def min_score(self) -> float:
+        return self.t.min_score
+
+    @min_score.setter
+    def min_score(self, value) -> None:
+        self._set_threshold("min_score", value)
+
+    @property
+    def max_vwap_abs(self) -> float:
+        return self.t.max_vwap_abs
+
+    @max_vwap_abs.setter
+    def max_vwap_abs(self, value) -> None:
+        self._set_threshold("max_vwap_abs", value)
+
+    @property
+    def min_volume_mult(self) -> float:
+        return self.t.min_volume_mult
+
+    @min_volume_mult.setter
+    def min_volume_mult(self, value) -> None:
+        self._set_threshold("min_volume_mult", value)
+
+    @property
+    def atr_range(self) -> Tuple[float, float]:
+        return self.t.atr_range
+
+    @atr_range.setter
+    def atr_range(self, value) -> None:
+        self._set_threshold("atr_range", value)
+
+    @property
+    def event_block_tags(self) -> frozenset:
+        return self.t.event_block_tags
+
+    @event_block_tags.setter
+    def event_block_tags(self, value) -> None:
+        self._set_threshold("event_block_tags", value)
+
+    @property
+    def ema_bonus(self) -> float:
+        return self.t.ema_bonus
+
+    @ema_bonus.setter
+    def ema_bonus(self, value) -> None:
+        self._set_threshold("ema_bonus", value)
+
+    @property
+    def vwap_near_bonus(self) -> float:
+        return self.t.vwap_near_bonus
+
+    @vwap_near_bonus.setter
+    def vwap_near_bonus(self, value) -> None:
+        self._set_threshold("vwap_near_bonus", value)
+
+    @property
+    def penalty_low_volume(self) -> float:
+        return self.t.penalty_low_volume
+
+    @penalty_low_volume.setter
+    def penalty_low_volume(self, value) -> None:
+        self._set_threshold("penalty_low_volume", value)
+
+    @property
+    def penalty_weak_trend(self) -> float:
+        return self.t.penalty_weak_trend
+
+    @penalty_weak_trend.setter
+    def penalty_weak_trend(self, value) -> None:
+        self._set_threshold("penalty_weak_trend", value)
+
+    @property
+    def penalty_suboptimal_vol(self) -> float:
+        return self.t.penalty_suboptimal_vol
+
+    @penalty_suboptimal_vol.setter
+    def penalty_suboptimal_vol(self, value) -> None:
+        self._set_threshold("penalty_suboptimal_vol", value)
+
+    @property
+    def penalty_far_vwap(self) -> float:
+        return self.t.penalty_far_vwap
 
-        # Thresholds
-        th = (self.config.get("prefilter", {}) or {})
-        self.min_score = float(th.get("min_score", 70.0))
-        self.max_vwap_abs = float(th.get("max_vwap_abs", 2.0))              # far from VWAP → risky
-        self.min_volume_mult = float(th.get("min_volume_mult", 1.2))        # < 1.2x volume → low_volume
-        self.atr_range: Tuple[float, float] = tuple(th.get("atr_range", [0.6, 2.2]))  # outside → suboptimal_volatility
-        self.event_block_tags = set(th.get("event_block_tags", ["FOMC", "CPI", "NFP"]))
-
-        # Bonuses/Penalties
-        self.ema_bonus = float(th.get("ema_bonus", 2.0))
-        self.vwap_near_bonus = float(th.get("vwap_near_bonus", 1.0))
-        self.penalty_low_volume = float(th.get("penalty_low_volume", 2.0))
-        self.penalty_weak_trend = float(th.get("penalty_weak_trend", 1.5))
-        self.penalty_suboptimal_vol = float(th.get("penalty_suboptimal_vol", 1.0))
-        self.penalty_far_vwap = float(th.get("penalty_far_vwap", 1.0))
-        self.penalty_lunch = float(th.get("penalty_lunch", 3.0))
-        self.penalty_outside_hours = float(th.get("penalty_outside_hours", 99.0))  # auto-kill
+    @penalty_far_vwap.setter
+    def penalty_far_vwap(self, value) -> None:
+        self._set_threshold("penalty_far_vwap", value)
+
+    @property
+    def penalty_lunch(self) -> float:
+        return self.t.penalty_lunch
+
+    @penalty_lunch.setter
+    def penalty_lunch(self, value) -> None:
+        self._set_threshold("penalty_lunch", value)
+
+    @property
+    def penalty_outside_hours(self) -> float:
+        return self.t.penalty_outside_hours
+
+    @penalty_outside_hours.setter
+    def penalty_outside_hours(self, value) -> None:
+        self._set_threshold("penalty_outside_hours", value)
+
+    def _set_threshold(self, name: str, value) -> None:
+        self.t = replace(self.t, **{name: Thresholds.coerce(name, value)})
 
     # ---------- Public API ----------
 
@@ -85,19 +329,21 @@ class PremiumFilter:
         raw must include:
           symbol, setup_type, direction, indicators, regime, timestamp (UTC or aware)
         """
+        t = self.t
+
         # Timestamp
         ts = raw.get("timestamp")
         if not isinstance(ts, datetime):
             ts = datetime.now(timezone.utc)
 
         # Session validation
-        sess = self.validator.validate_session(ts)  # dict with flags + session label
-        session_label = sess.get("current_session", "outside_hours")
-        if not sess.get("tradable_now", False):
+        sess = self.validator.validate_session(ts)  # SessionResult: flags + session label
+        session_label = sess.current_session
+        if not sess.tradable_now:
             # mark risk factors; we may still compute but will likely return None
             rf = []
-            if sess.get("is_weekend"): rf.append("weekend_block")
-            if sess.get("is_holiday"): rf.append("holiday_block")
+            if sess.is_weekend: rf.append("weekend_block")
+            if sess.is_holiday: rf.append("holiday_block")
             if session_label == "lunch_block": rf.append("lunch_block")
             rf.append("outside_hours")
             # outright block
@@ -114,34 +360,21 @@ class PremiumFilter:
         vwap_dist = float(ind.get("vwap_distance", 0.0))
         wick = float(ind.get("wickiness", 1.0))
         trend_strength = float(ind.get("trend_strength", 0.0))
-        news_tags = set(ind.get("news_tags", []) or [])
+        news_tags = ind.get("news_tags") or ()
 
-        # Hard negative: major event block
-        if self.event_block_tags.intersection(news_tags):
+        # Hard negative: major event block (isdisjoint allocates nothing)
+        if not t.event_block_tags.isdisjoint(news_tags):
             return None  # don’t form candidate at all
 
         # Confluence scoring
         setup = raw.get("setup_type", "Unknown")
         direction = raw.get("direction", "long")
-        try:
-            setup_enum = SetupType[setup] if isinstance(setup, str) else setup
-        except Exception:
-            setup_enum = SetupType.ORB  # sane default
-
-        conf_score, conf_factors = self.scorer.score(
-            setup_type=setup_enum,
-            direction=direction,
-            ema_alignment=ema_alignment,
-            volume_multiple=volume_mult,
-            atr_5m=atr_5m,
-            vwap_distance=vwap_dist,
-            wickiness=wick,
-            trend_strength=trend_strength,
-            extras=ind
+        conf_score, conf_factors = self._score_confluence(
+            setup, direction, ind, ema_alignment, volume_mult, atr_5m, vwap_dist, wick, trend_strength
         )
 
         # Negatives (risk) extraction
-        risk_factors = self._extract_risk_factors(
+        risk_factors, rf_bits = self._extract_risk_factors(
             volume_mult=volume_mult,
             ema_alignment=ema_alignment,
             atr_5m=atr_5m,
@@ -157,10 +390,10 @@ class PremiumFilter:
             vwap_distance=vwap_dist,
             volume_mult=volume_mult,
             atr_5m=atr_5m,
-            risk_factors=risk_factors
+            rf_bits=rf_bits
         )
 
-        if score < self.min_score:
+        if score < t.min_score:
             return None
 
         return TradingCandidate(
@@ -170,7 +403,7 @@ class PremiumFilter:
             timestamp=ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc),
             session_label=session_label,
             market_regime=raw.get("regime", "mixed"),
-            prefilter_score=round(score, 2),
+            prefilter_score=score,
             confluence_factors=conf_factors,
             ema_alignment=ema_alignment,
             volume_multiple=volume_mult,
@@ -180,8 +413,148 @@ class PremiumFilter:
             risk_factors=risk_factors
         )
 
+    def evaluate_batch(self, raws: List[Dict]) -> TradingCandidateColumns:
+        """
+        evaluate() over many raw dicts.
+        Only partly vectorized: the session gate, event block, indicator field
+        extraction and scorer.score() call still run once per candidate in
+        Python; risk factors, bonuses/penalties and the min-score cut run as
+        NumPy masks over the remaining rows.
+        Survivors are written straight into columns; source_index maps each
+        row back to its position in raws (row k == evaluate(raws[source_index[k]])).
+        """
+        t = self.t
+        out = TradingCandidateColumns()
+
+        # Per-candidate stage: session gate, event block, confluence score
+        rows, stamps, labels, setups, directions, factors = [], [], [], [], [], []
+        emas, conf, vol, atr, vwap, wick, trend = [], [], [], [], [], [], []
+        for i, raw in enumerate(raws):
+            ts = raw.get("timestamp")
+            if not isinstance(ts, datetime):
+                ts = datetime.now(timezone.utc)
+            sess = self.validator.validate_session(ts)
+            if not sess.tradable_now:
+                continue
+
+            ind = raw.get("indicators", {}) or {}
+            if not t.event_block_tags.isdisjoint(ind.get("news_tags") or ()):
+                continue
+
+            ema_alignment = ind.get("ema_alignment", "mixed")
+            volume_mult = float(ind.get("volume_multiple", 1.0))
+            atr_5m = float(ind.get("atr_5m", 1.0))
+            vwap_dist = float(ind.get("vwap_distance", 0.0))
+            wk = float(ind.get("wickiness", 1.0))
+            ts_strength = float(ind.get("trend_strength", 0.0))
+            setup = raw.get("setup_type", "Unknown")
+            direction = raw.get("direction", "long")
+            conf_score, conf_factors = self._score_confluence(
+                setup, direction, ind, ema_alignment, volume_mult, atr_5m, vwap_dist, wk, ts_strength
+            )
+
+            rows.append(i)
+            stamps.append(ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc))
+            labels.append(sess.current_session)
+            setups.append(setup)
+            directions.append(direction)
+            factors.append(conf_factors)
+            emas.append(ema_alignment)
+            conf.append(float(conf_score))
+            vol.append(volume_mult)
+            atr.append(atr_5m)
+            vwap.append(vwap_dist)
+            wick.append(wk)
+            trend.append(ts_strength)
+
+        if not rows:
+            return out
+
+        # Vectorized stage: same risk factors and score shaping as evaluate()
+        vol_a, atr_a, vwap_a, trend_a = (np.asarray(x, dtype=np.float64) for x in (vol, atr, vwap, trend))
+        abs_vwap = np.abs(vwap_a)
+        lo, hi = t.atr_range
+        lunch = np.fromiter((lbl == "lunch_block" for lbl in labels), dtype=bool, count=len(rows))
+        mixed = np.fromiter((e == "mixed" for e in emas), dtype=bool, count=len(rows))
+        aligned = np.fromiter((e in ("bullish_aligned", "bearish_aligned") for e in emas), dtype=bool, count=len(rows))
+
+        low_vol = vol_a < t.min_volume_mult
+        weak_trend = mixed | (trend_a < 0.25)
+        subopt_vol = (atr_a < lo) | (atr_a > hi)
+        far_vwap = abs_vwap > t.max_vwap_abs
+
+        # Accumulated in evaluate()'s order so totals match it exactly
+        score = np.asarray(conf, dtype=np.float64)
+        score += t.ema_bonus * aligned
+        score += t.vwap_near_bonus * (abs_vwap <= 0.5)
+        score += 1.0 * (vol_a > 2.0)
+        score += 0.5 * ((atr_a >= lo) & (atr_a <= hi))
+        score -= t.penalty_low_volume * low_vol
+        score -= t.penalty_weak_trend * weak_trend
+        score -= t.penalty_suboptimal_vol * subopt_vol
+        score -= t.penalty_far_vwap * far_vwap
+        score -= t.penalty_lunch * lunch
+        np.clip(score, 0.0, 100.0, out=score)
+
+        masks = (
+            ("lunch_block", lunch),
+            ("low_volume", low_vol),
+            ("weak_trend_alignment", weak_trend),
+            ("suboptimal_volatility", subopt_vol),
+            ("far_from_vwap", far_vwap),
+        )
+        keep = np.flatnonzero(~(score < t.min_score))
+        source = np.asarray(rows, dtype=np.int64)[keep]
+        out.append_bulk(
+            symbol=[raws[i].get("symbol", "MES=F") for i in source],
+            setup_type=[setups[k] for k in keep],
+            direction=[directions[k] for k in keep],
+            timestamp=[stamps[k] for k in keep],
+            session_label=[labels[k] for k in keep],
+            market_regime=[raws[i].get("regime", "mixed") for i in source],
+            prefilter_score=score[keep],
+            confluence_factors=[factors[k] for k in keep],
+            ema_alignment=[emas[k] for k in keep],
+            volume_multiple=vol_a[keep],
+            atr_5m=atr_a[keep],
+            vwap_distance=vwap_a[keep],
+            wickiness=np.asarray(wick, dtype=np.float64)[keep],
+            risk_factors=[[name for name, mask in masks if mask[k]] for k in keep],
+            source_index=source
+        )
+        return out
+
     # ---------- Internals ----------
 
+    def _score_confluence(
+        self,
+        setup,
+        direction: str,
+        ind: Dict,
+        ema_alignment: str,
+        volume_mult: float,
+        atr_5m: float,
+        vwap_dist: float,
+        wick: float,
+        trend_strength: float
+    ) -> Tuple[float, List[str]]:
+        if isinstance(setup, str):
+            setup_enum = self._setup_lookup.get(setup, SetupType.NONE)  # unknown name -> no setup
+        else:
+            setup_enum = setup
+
+        return self.scorer.score(
+            setup_type=setup_enum,
+            direction=direction,
+            ema_alignment=ema_alignment,
+            volume_multiple=volume_mult,
+            atr_5m=atr_5m,
+            vwap_distance=vwap_dist,
+            wickiness=wick,
+            trend_strength=trend_strength,
+            extras=ind
+        )
+
     def _extract_risk_factors(
         self,
         *,
@@ -191,31 +564,40 @@ class PremiumFilter:
         vwap_distance: float,
         session_label: str,
         trend_strength: float
-    ) -> List[str]:
+    ) -> Tuple[List[str], int]:
+        """Risk factors as (names, RF_* bitmap)."""
+        t = self.t
+        min_volume_mult, max_vwap_abs = t.min_volume_mult, t.max_vwap_abs
+        lo, hi = t.atr_range
         rf: List[str] = []
+        rf_bits = 0
 
         # Session negatives
         if session_label == "lunch_block":
             rf.append("lunch_block")
+            rf_bits |= RF_LUNCH
 
         # Volume
-        if volume_mult < self.min_volume_mult:
+        if volume_mult < min_volume_mult:
             rf.append("low_volume")
+            rf_bits |= RF_LOW_VOL
 
         # EMA / trend alignment
         if ema_alignment == "mixed" or trend_strength < 0.25:
             rf.append("weak_trend_alignment")
+            rf_bits |= RF_WEAK
 
         # Volatility window
-        lo, hi = self.atr_range
         if atr_5m < lo or atr_5m > hi:
             rf.append("suboptimal_volatility")
+            rf_bits |= RF_SUBOPT
 
         # VWAP distance
-        if abs(vwap_distance) > self.max_vwap_abs:
+        if abs(vwap_distance) > max_vwap_abs:
             rf.append("far_from_vwap")
+            rf_bits |= RF_FAR
 
-        return rf
+        return rf, rf_bits
 
     def _compute_prefilter_score(
         self,
@@ -225,36 +607,15 @@ class PremiumFilter:
         vwap_distance: float,
         volume_mult: float,
         atr_5m: float,
-        risk_factors: List[str]
+        rf_bits: int
     ) -> float:
-        score = float(base_conf)
-
-        # Bonuses
-        if ema_alignment in ("bullish_aligned", "bearish_aligned"):
-            score += self.ema_bonus
-        if abs(vwap_distance) <= 0.5:
-            score += self.vwap_near_bonus
-
-        # Light quality shaping
-        if volume_mult > 2.0:
-            score += 1.0
-        lo, hi = self.atr_range
-        if lo <= atr_5m <= hi:
-            score += 0.5
-
-        # Penalties from negatives (stacking)
-        if "low_volume" in risk_factors:
-            score -= self.penalty_low_volume
-        if "weak_trend_alignment" in risk_factors:
-            score -= self.penalty_weak_trend
-        if "suboptimal_volatility" in risk_factors:
-            score -= self.penalty_suboptimal_vol
-        if "far_from_vwap" in risk_factors:
-            score -= self.penalty_far_vwap
-        if "lunch_block" in risk_factors:
-            score -= self.penalty_lunch
-        if "outside_hours" in risk_factors:
-            score -= self.penalty_outside_hours  # effectively 0
-
-        # Clamp
-        return max(0.0, min(100.0, score))
+        t = self.t
+        lo, hi = t.atr_range
+
+        return compute_score(
+            float(base_conf), _EMA_CODES.get(ema_alignment, 0), vwap_distance, volume_mult,
+            atr_5m, lo, hi, rf_bits,
+            t.ema_bonus, t.vwap_near_bonus,
+            t.penalty_low_volume, t.penalty_weak_trend, t.penalty_suboptimal_vol,
+            t.penalty_far_vwap, t.penalty_lunch, t.penalty_outside_hours
+        )
@@ -3,11 +3,44 @@ Session Validator
 Validates trading sessions and market hours for MES scalping system.
 """
 
-from datetime import datetime, time
-import pytz
-from typing import Dict, Tuple, Optional
+from datetime import datetime, time, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+from typing import Dict, NamedTuple, Tuple, Optional
+import numpy as np
 import pandas as pd
 
+try:
+    import pandas_market_calendars as mcal
+except Exception:
+    mcal = None
+
+# Fallback fixed-date closures (month, day): New Year's, Independence Day, Christmas
+_FIXED_HOLIDAYS = frozenset({(1, 1), (7, 4), (12, 25)})
+
+
+@lru_cache(maxsize=4096)
+def _local_minute(epoch_minute: int, tz_name: str) -> datetime:
+    """Wall-clock datetime in tz_name for a UTC epoch minute (memoized)."""
+    return datetime.fromtimestamp(epoch_minute * 60, ZoneInfo(tz_name))
+
+
+class SessionResult(NamedTuple):
+    """Session validation flags returned by SessionValidator.validate_session."""
+    in_rth_a: bool
+    in_rth_b: bool
+    in_lunch_block: bool
+    is_weekend: bool
+    is_holiday: bool
+    tradable_now: bool
+    current_session: str
+    ct_time: str
+    ct_date: str
+    
+    def as_dict(self) -> Dict:
+        """Mapping form (the pre-SessionResult dict shape)."""
+        return self._asdict()
+
 
 class SessionValidator:
     """
@@ -31,12 +64,16 @@ class SessionValidator:
             config: Configuration dict containing sessions settings
         """
         self.config = config
-        self.ct_tz = pytz.timezone(config['meta']['timezone'])
-        self.utc_tz = pytz.UTC
+        self.tz_name = config['meta']['timezone']
+        self.ct_tz = ZoneInfo(self.tz_name)
+        self.utc_tz = timezone.utc
         
         # Parse session times from config
         self.sessions = self._parse_session_times(config['sessions'])
         
+        # Exchange holiday dates when pandas_market_calendars is installed
+        self._holidays = self._load_holidays()
+        
     def _parse_session_times(self, sessions_config: Dict) -> Dict:
         """
         Parse session time strings into time objects.
@@ -64,6 +101,12 @@ class SessionValidator:
         sessions['lunch_start'] = self._parse_time(lunch[0])
         sessions['lunch_end'] = self._parse_time(lunch[1])
         
+        # Minute-of-day bounds for the validate_session hot path
+        for name in ('rth_a', 'rth_b', 'lunch'):
+            for edge in ('start', 'end'):
+                t = sessions[f'{name}_{edge}']
+                sessions[f'{name}_{edge}_min'] = t.hour * 60 + t.minute
+        
         return sessions
     
     def _parse_time(self, time_str: str) -> time:
@@ -74,8 +117,22 @@ class SessionValidator:
     def _to_ct_time(self, utc_timestamp: datetime) -> datetime:
         """Convert UTC timestamp to CT."""
         if utc_timestamp.tzinfo is None:
-            utc_timestamp = self.utc_tz.localize(utc_timestamp)
-        return utc_timestamp.astimezone(self.ct_tz)
+            utc_timestamp = utc_timestamp.replace(tzinfo=timezone.utc)
+        # Offsets are whole minutes, so only the minute bucket needs converting
+        epoch_minute = int(utc_timestamp.timestamp() // 60)
+        return _local_minute(epoch_minute, self.tz_name).replace(
+            second=utc_timestamp.second, microsecond=utc_timestamp.microsecond
+        )
+    
+    def _load_holidays(self) -> Optional[frozenset]:
+        """CME equity futures closure dates, or None without pandas_market_calendars."""
+        if mcal is None:
+            return None
+        try:
+            closures = mcal.get_calendar("CME_Equity").holidays().holidays
+        except Exception:
+            return None
+        return frozenset(pd.Timestamp(d).date() for d in closures)
     
     def _is_weekend(self, dt: datetime) -> bool:
         """Check if timestamp falls on weekend."""
@@ -85,28 +142,14 @@ class SessionValidator:
         """
         Check if timestamp falls on a major US market holiday.
         
-        Note: This is a simplified check. For production, consider using
-        a proper holiday calendar like pandas_market_calendars.
+        Uses the CME_Equity calendar from pandas_market_calendars when it is
+        installed; otherwise a simplified fixed-date check (not exhaustive).
         """
-        # Major holidays when futures markets are closed
-        # New Year's Day, Martin Luther King Jr. Day, Presidents Day,
-        # Good Friday, Memorial Day, Independence Day, Labor Day,
-        # Thanksgiving, Christmas Day
-        
-        year = dt.year
-        month = dt.month
-        day = dt.day
-        
-        # Simple holiday checks (not exhaustive)
-        major_holidays = [
-            (1, 1),   # New Year's Day
-            (7, 4),   # Independence Day  
-            (12, 25), # Christmas Day
-        ]
-        
-        return (month, day) in major_holidays
+        if self._holidays is not None:
+            return dt.date() in self._holidays
+        return (dt.month, dt.day) in _FIXED_HOLIDAYS
     
-    def validate_session(self, timestamp: datetime) -> Dict[str, bool]:
+    def validate_session(self, timestamp: datetime) -> SessionResult:
         """
         Validate trading session for given timestamp.
         
@@ -114,20 +157,25 @@ class SessionValidator:
             timestamp: UTC or timezone-aware datetime
             
         Returns:
-            Dict with session validation flags
+            SessionResult with session validation flags
         """
         # Convert to CT
         ct_time = self._to_ct_time(timestamp)
-        current_time = ct_time.time()
+        
+        # Minute of day; an end bound (HH:MM:00) only includes its own minute
+        # at exactly :00, so past it the last inclusive minute is one earlier
+        cm = ct_time.hour * 60 + ct_time.minute
+        past = 1 if (ct_time.second or ct_time.microsecond) else 0
         
         # Weekend/holiday checks
         is_weekend = self._is_weekend(ct_time)
         is_holiday = self._is_holiday(ct_time)
         
         # Session time checks
-        in_rth_a = (self.sessions['rth_a_start'] <= current_time <= self.sessions['rth_a_end'])
-        in_rth_b = (self.sessions['rth_b_start'] <= current_time <= self.sessions['rth_b_end'])
-        in_lunch_block = (self.sessions['lunch_start'] <= current_time <= self.sessions['lunch_end'])
+        s = self.sessions
+        in_rth_a = s['rth_a_start_min'] <= cm <= s['rth_a_end_min'] - past
+        in_rth_b = s['rth_b_start_min'] <= cm <= s['rth_b_end_min'] - past
+        in_lunch_block = s['lunch_start_min'] <= cm <= s['lunch_end_min'] - past
         
         # Overall tradable determination
         tradable_now = (
@@ -137,17 +185,63 @@ class SessionValidator:
             not in_lunch_block
         )
         
-        return {
+        return SessionResult(
+            in_rth_a,
+            in_rth_b,
+            in_lunch_block,
+            is_weekend,
+            is_holiday,
+            tradable_now,
+            self._get_current_session(in_rth_a, in_rth_b, in_lunch_block),
+            ct_time.strftime('%H:%M:%S'),
+            ct_time.strftime('%Y-%m-%d')
+        )
+    
+    def validate_session_vectorized(self, idx: pd.DatetimeIndex) -> pd.DataFrame:
+        """
+        validate_session() over a whole DatetimeIndex (e.g. backtest bars).
+        
+        Args:
+            idx: UTC or timezone-aware DatetimeIndex (naive is treated as UTC)
+            
+        Returns:
+            DataFrame indexed by idx with the validate_session() flags and
+            current_session (ct_time/ct_date are left to the caller)
+        """
+        if idx.tz is None:
+            idx = idx.tz_localize('UTC')
+        ct = idx.tz_convert(self.tz_name)
+        
+        # Same minute-of-day rule as validate_session (end bound inclusive at :00 only)
+        mins = ct.hour.to_numpy(dtype=np.int32) * 60 + ct.minute.to_numpy(dtype=np.int32)
+        past = ((ct.second.to_numpy() != 0) | (ct.microsecond.to_numpy() != 0)
+                | (ct.nanosecond.to_numpy() != 0)).astype(np.int32)
+        s = self.sessions
+        in_rth_a = (mins >= s['rth_a_start_min']) & (mins <= s['rth_a_end_min'] - past)
+        in_rth_b = (mins >= s['rth_b_start_min']) & (mins <= s['rth_b_end_min'] - past)
+        in_lunch = (mins >= s['lunch_start_min']) & (mins <= s['lunch_end_min'] - past)
+        
+        is_weekend = ct.weekday.to_numpy() >= 5
+        if self._holidays is not None:
+            is_holiday = np.fromiter((d in self._holidays for d in ct.date), dtype=bool, count=len(ct))
+        else:
+            month_day = ct.month.to_numpy() * 100 + ct.day.to_numpy()
+            is_holiday = np.isin(month_day, [m * 100 + d for m, d in _FIXED_HOLIDAYS])
+        
+        tradable = ~is_weekend & ~is_holiday & (in_rth_a | in_rth_b) & ~in_lunch
+        current_session = np.select(
+            [in_rth_a, in_rth_b, in_lunch], ['rth_a', 'rth_b', 'lunch_block'], 'outside_hours'
+        )
+        
+        return pd.DataFrame({
             'in_rth_a': in_rth_a,
-            'in_rth_b': in_rth_b, 
-            'in_lunch_block': in_lunch_block,
+            'in_rth_b': in_rth_b,
+            'in_lunch_block': in_lunch,
             'is_weekend': is_weekend,
             'is_holiday': is_holiday,
-            'tradable_now': tradable_now,
-            'current_session': self._get_current_session(in_rth_a, in_rth_b, in_lunch_block),
-            'ct_time': ct_time.strftime('%H:%M:%S'),
-            'ct_date': ct_time.strftime('%Y-%m-%d')
-        }
+            'tradable_now': tradable,
+            'current_session': current_session,
+        }, index=idx)
     
     def _get_current_session(self, in_rth_a: bool, in_rth_b: bool, in_lunch_block: bool) -> str:
         """Determine current session label."""
@@ -176,20 +270,12 @@ class SessionValidator:
         boundaries = {}
         
         # RTH A boundaries
-        rth_a_start_ct = self.ct_tz.localize(
-            datetime.combine(ct_date, self.sessions['rth_a_start'])
-        )
-        rth_a_end_ct = self.ct_tz.localize(
-            datetime.combine(ct_date, self.sessions['rth_a_end'])
-        )
+        rth_a_start_ct = datetime.combine(ct_date, self.sessions['rth_a_start'], tzinfo=self.ct_tz)
+        rth_a_end_ct = datetime.combine(ct_date, self.sessions['rth_a_end'], tzinfo=self.ct_tz)
         
         # RTH B boundaries  
-        rth_b_start_ct = self.ct_tz.localize(
-            datetime.combine(ct_date, self.sessions['rth_b_start'])
-        )
-        rth_b_end_ct = self.ct_tz.localize(
-            datetime.combine(ct_date, self.sessions['rth_b_end'])
-        )
+        rth_b_start_ct = datetime.combine(ct_date, self.sessions['rth_b_start'], tzinfo=self.ct_tz)
+        rth_b_end_ct = datetime.combine(ct_date, self.sessions['rth_b_end'], tzinfo=self.ct_tz)
         
         # Convert to UTC
         boundaries = {
@@ -213,8 +299,7 @@ class SessionValidator:
         Returns:
             True if valid for trading, False otherwise
         """
-        validation = self.validate_session(timestamp)
-        return validation['tradable_now']
+        return self.validate_session(timestamp).tradable_now
     
     def get_next_trading_session(self, current_time: datetime) -> Optional[Dict]:
         """
@@ -270,7 +355,7 @@ class SessionValidator:
 # Edge cases and behavior notes:
 """
 DST Changes:
-- pytz handles DST transitions automatically
+- zoneinfo handles DST transitions automatically
 - Session times remain constant in CT (08:30, 10:30, 13:00, 15:00)
 - UTC conversion adjusts for DST spring forward/fall back
 
@@ -284,7 +369,7 @@ Weekend Handling:
 - Sunday evening futures trading not considered in this implementation
 - Could be extended for 24/5 futures trading if needed
 
-Session Validation Return Example:
+Session Validation Return Example (SessionResult.as_dict()):
 {
     'in_rth_a': True,
     'in_rth_b': False,
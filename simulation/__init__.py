@@ -3,11 +3,16 @@ Simulation Module
 Realistic trade simulation with advanced bracket orders.
 """
 
-from .realistic_sim import RealisticSimulator, TradeResult, ExitReason, TradeDirection
+from .realistic_sim import RealisticSimulator, TradeResult, BatchTradeResults, ExitReason, TradeDirection
+from .candles import generate_simulated_candles
+from .sweep import sweep_configs
 
 __all__ = [
     'RealisticSimulator',
     'TradeResult', 
+    'BatchTradeResults',
     'ExitReason',
-    'TradeDirection'
+    'TradeDirection',
+    'generate_simulated_candles',
+    'sweep_configs'
 ]
\ No newline at end of file
@@ -0,0 +1,234 @@
+"""
+Simulation Kernels
+Bar-walk state machine for RealisticSimulator, JIT-compiled when numba is available.
+"""
+
+import numpy as np
+from typing import Tuple
+
+from _njit import njit, prange
+
+# Exit reason codes returned by walk_trade (mapped back to ExitReason by the simulator)
+EXIT_TP, EXIT_SL, EXIT_BE, EXIT_TRAIL, EXIT_TIMEOUT, EXIT_MANUAL = range(6)
+
+@njit(inline='always')
+def _walk(ohlc: np.ndarray, ts_ns: np.ndarray, entry_ts_ns: int,
+          entry: float, sign: int, tp: float, sl: float,
+          be_thr: float, trail_start: float, trail_dist: float,
+          timeout_min: float, managed: bool) -> Tuple[int, float, int, float, float, int, int]:
+    """
+    Walk bars forward from entry until a bracket, timeout or the data ends.
+
+    Inlined into walk_long / walk_short (and their _plain variants) with
+    `sign` and `managed` as literals, so the direction selects and, for plain
+    brackets, the whole BE/trailing block fold away at compile time.
+
+    Same per-bar rules as RealisticSimulator: timeout check, MAE/MFE, BE move,
+    trail activation/update, then an Open -> High/Low -> Close price walk
+    checking stop before target.
+
+    Args:
+        ohlc: (N, 4) C-contiguous float64 bars (cols: O, H, L, C)
+        ts_ns: Bar timestamps, int64 ns since epoch (UTC)
+        entry_ts_ns: Entry timestamp, int64 ns since epoch (UTC)
+        entry: Filled (slipped) entry price
+        sign: +1 for long, -1 for short
+        tp, sl: Initial take-profit / stop levels
+        be_thr, trail_start, trail_dist: Risk settings in points
+        timeout_min: Timeout in minutes
+        managed: False for a plain bracket (breakeven disabled, so no trailing)
+
+    Returns:
+        (exit_idx, exit_price, exit_reason code, mae, mfe,
+         time_to_be_s, time_to_target_s) - times are -1 when not reached,
+        exit_idx is -1 when there are no bars
+    """
+    n = ohlc.shape[0]
+    fsign = float(sign)
+    be_level = entry + fsign * be_thr
+    trail_level = entry + fsign * trail_start
+    trail_off = fsign * trail_dist
+    timeout_ns = timeout_min * 60e9
+    current_sl = sl
+    be_moved = False
+    trail_active = False
+    mae = 0.0
+    mfe = 0.0
+    time_to_be = -1
+    time_to_target = -1
+
+    for i in range(n):
+        o = ohlc[i, 0]
+        h = ohlc[i, 1]
+        l = ohlc[i, 2]
+        c = ohlc[i, 3]
+        elapsed_ns = ts_ns[i] - entry_ts_ns
+        elapsed_s = elapsed_ns / 1e9
+
+        # Timeout BEFORE processing the bar - exit at its close
+        if elapsed_ns >= timeout_ns:
+            return i, c, EXIT_TIMEOUT, mae, mfe, time_to_be, time_to_target
+
+        # MAE/MFE, BE move, trailing activation/update; direction folded into
+        # fsign against precomputed levels (exact: only signs of differences)
+        fav = h if sign > 0 else l
+        adv = l if sign > 0 else h
+        mfe = max(mfe, fsign * (fav - entry))
+        mae = max(mae, fsign * (entry - adv))
+        if managed:
+            if not be_moved and fsign * (fav - be_level) >= 0:
+                current_sl = entry
+                be_moved = True
+                time_to_be = int(elapsed_s)
+            if not trail_active and be_moved and fsign * (fav - trail_level) >= 0:
+                trail_active = True
+            if trail_active:
+                new_stop = fav - trail_off
+                if fsign * (new_stop - current_sl) > 0:
+                    current_sl = new_stop
+
+        # Intrabar price walk: Open -> High/Low (by bar color) -> Close; a wick
+        # equal to the open just re-checks the open with unchanged state
+        walk = (o, l, h, c) if c > o else (o, h, l, c)
+
+        for k in range(4):
+            price = walk[k]
+            # Stop loss / BE / trailing
+            if fsign * (price - current_sl) <= 0:
+                if trail_active:
+                    reason = EXIT_TRAIL
+                elif be_moved:
+                    reason = EXIT_BE
+                else:
+                    reason = EXIT_SL
+                return i, current_sl, reason, mae, mfe, time_to_be, time_to_target
+            # Take profit
+            if fsign * (price - tp) >= 0:
+                if time_to_target < 0:
+                    time_to_target = int(elapsed_s)
+                return i, tp, EXIT_TP, mae, mfe, time_to_be, time_to_target
+
+    # Still open - force close at the last close
+    if n == 0:
+        return -1, np.nan, EXIT_MANUAL, mae, mfe, time_to_be, time_to_target
+    return n - 1, ohlc[n - 1, 3], EXIT_MANUAL, mae, mfe, time_to_be, time_to_target
+
+
+@njit(cache=True)
+def walk_long(ohlc: np.ndarray, ts_ns: np.ndarray, entry_ts_ns: int, entry: float,
+              tp: float, sl: float, be_thr: float, trail_start: float, trail_dist: float,
+              timeout_min: float) -> Tuple[int, float, int, float, float, int, int]:
+    """walk_trade() specialized for long trades."""
+    return _walk(ohlc, ts_ns, entry_ts_ns, entry, 1, tp, sl, be_thr, trail_start, trail_dist, timeout_min, True)
+
+
+@njit(cache=True)
+def walk_long_plain(ohlc: np.ndarray, ts_ns: np.ndarray, entry_ts_ns: int, entry: float,
+                    tp: float, sl: float, be_thr: float, trail_start: float, trail_dist: float,
+                    timeout_min: float) -> Tuple[int, float, int, float, float, int, int]:
+    """walk_long() without the breakeven / trailing state machine."""
+    return _walk(ohlc, ts_ns, entry_ts_ns, entry, 1, tp, sl, be_thr, trail_start, trail_dist, timeout_min, False)
+
+
+@njit(cache=True)
+def walk_short(ohlc: np.ndarray, ts_ns: np.ndarray, entry_ts_ns: int, entry: float,
+               tp: float, sl: float, be_thr: float, trail_start: float, trail_dist: float,
+               timeout_min: float) -> Tuple[int, float, int, float, float, int, int]:
+    """walk_trade() specialized for short trades."""
+    return _walk(ohlc, ts_ns, entry_ts_ns, entry, -1, tp, sl, be_thr, trail_start, trail_dist, timeout_min, True)
+
+
+@njit(cache=True)
+def walk_short_plain(ohlc: np.ndarray, ts_ns: np.ndarray, entry_ts_ns: int, entry: float,
+                     tp: float, sl: float, be_thr: float, trail_start: float, trail_dist: float,
+                     timeout_min: float) -> Tuple[int, float, int, float, float, int, int]:
+    """walk_short() without the breakeven / trailing state machine."""
+    return _walk(ohlc, ts_ns, entry_ts_ns, entry, -1, tp, sl, be_thr, trail_start, trail_dist, timeout_min, False)
+
+
+@njit(cache=True)
+def walk_trade(ohlc: np.ndarray, ts_ns: np.ndarray, entry_ts_ns: int,
+               entry: float, sign: int, tp: float, sl: float,
+               be_thr: float, trail_start: float, trail_dist: float,
+               timeout_min: float) -> Tuple[int, float, int, float, float, int, int]:
+    """
+    Dispatch one trade by sign (+1 / -1) to walk_long / walk_short, or to the
+    _plain variants when breakeven is disabled (be_thr = inf); see _walk().
+    """
+    if be_thr == np.inf:
+        if sign > 0:
+            return walk_long_plain(ohlc, ts_ns, entry_ts_ns, entry, tp, sl, be_thr, trail_start, trail_dist, timeout_min)
+        return walk_short_plain(ohlc, ts_ns, entry_ts_ns, entry, tp, sl, be_thr, trail_start, trail_dist, timeout_min)
+    if sign > 0:
+        return walk_long(ohlc, ts_ns, entry_ts_ns, entry, tp, sl, be_thr, trail_start, trail_dist, timeout_min)
+    return walk_short(ohlc, ts_ns, entry_ts_ns, entry, tp, sl, be_thr, trail_start, trail_dist, timeout_min)
+
+
+@njit(parallel=True, cache=True)
+def walk_trades_batch(ohlc: np.ndarray, ts_ns: np.ndarray, entry_idx: np.ndarray,
+                      entry: np.ndarray, sign: np.ndarray, tp: np.ndarray, sl: np.ndarray,
+                      be_thr: float, trail_start: float, trail_dist: float,
+                      timeout_min: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+                                                   np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    walk_trade() for N independent trades over one shared bar array.
+
+    Trade i enters at the open of bar entry_idx[i] and walks forward from
+    there; trades run in parallel (prange) when compiled.
+
+    Args:
+        ohlc: (N_bars, 4) C-contiguous float64 bars (cols: O, H, L, C)
+        ts_ns: Bar timestamps, int64 ns since epoch (UTC)
+        entry_idx: Entry bar index per trade
+        entry, sign, tp, sl: Filled entry, +1/-1 direction and initial
+            take-profit / stop level per trade
+        be_thr, trail_start, trail_dist, timeout_min: Shared risk settings
+
+    Returns:
+        Per-trade arrays (exit_idx, exit_price, exit_reason code, mae, mfe,
+        time_to_be_s, time_to_target_s); exit_idx indexes the shared bars
+    """
+    n = entry_idx.shape[0]
+    exit_idx = np.empty(n, dtype=np.int64)
+    exit_price = np.empty(n, dtype=np.float64)
+    reason = np.empty(n, dtype=np.int64)
+    mae = np.empty(n, dtype=np.float64)
+    mfe = np.empty(n, dtype=np.float64)
+    time_to_be = np.empty(n, dtype=np.int64)
+    time_to_target = np.empty(n, dtype=np.int64)
+
+    for t in prange(n):
+        s = entry_idx[t]
+        j, px, code, a, f, tbe, ttt = walk_trade(
+            ohlc[s:], ts_ns[s:], ts_ns[s], entry[t], sign[t], tp[t], sl[t],
+            be_thr, trail_start, trail_dist, timeout_min
+        )
+        exit_idx[t] = s + j
+        exit_price[t] = px
+        reason[t] = code
+        mae[t] = a
+        mfe[t] = f
+        time_to_be[t] = tbe
+        time_to_target[t] = ttt
+
+    return exit_idx, exit_price, reason, mae, mfe, time_to_be, time_to_target
+
+
+def warmup() -> None:
+    """
+    Run every kernel once on a tiny synthetic bar array.
+
+    Kernels compile lazily on first use (and are cached to disk); call this
+    explicitly, e.g. from a worker start hook, to pay that one-off cost
+    before the first real trade instead of during it.
+    """
+    ohlc = np.array([[100.0, 101.0, 99.0, 100.5],
+                     [100.5, 102.0, 100.0, 101.5]], dtype=np.float64)
+    ts_ns = np.array([0, 60_000_000_000], dtype=np.int64)
+    walk_long(ohlc, ts_ns, 0, 100.0, 102.0, 99.0, 0.5, 1.0, 0.5, 15.0)
+    walk_short(ohlc, ts_ns, 0, 100.0, 98.0, 101.0, 0.5, 1.0, 0.5, 15.0)
+    walk_long_plain(ohlc, ts_ns, 0, 100.0, 102.0, 99.0, np.inf, np.inf, 0.5, 15.0)
+    walk_short_plain(ohlc, ts_ns, 0, 100.0, 98.0, 101.0, np.inf, np.inf, 0.5, 15.0)
+    walk_trades_batch(ohlc, ts_ns, np.zeros(2, dtype=np.int64), np.full(2, 100.0),
+                      np.array([1, -1], dtype=np.int64), np.array([102.0, 98.0]),
+                      np.array([99.0, 101.0]), 0.5, 1.0, 0.5, 15.0)
@@ -0,0 +1,91 @@
+"""
+Simulated Candles
+Synthetic 1m OHLCV bars for exercising the simulator and prefilter offline.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Literal, Optional, Tuple
+
+__all__ = ['generate_simulated_candles', 'CANDLE_PRESETS']
+
+# (drift, volatility, trend_strength, chop_strength) per market regime
+CANDLE_PRESETS: Dict[str, Tuple[float, float, float, float]] = {
+    'slow': (0.0, 0.0001, 0.0, 0.00005),
+    'mid': (0.0, 0.0002, 0.00005, 0.0001),
+    'fast': (0.0, 0.0004, 0.0001, 0.0002),
+}
+
+
+def generate_simulated_candles(num_candles: int = 390,
+                               *,
+                               preset: Literal['fast', 'slow', 'mid'] = 'mid',
+                               start_price: float = 5800.0,
+                               drift: Optional[float] = None,
+                               volatility: Optional[float] = None,
+                               trend_strength: Optional[float] = None,
+                               chop_strength: Optional[float] = None,
+                               wick_scale: float = 0.25,
+                               start: Optional[pd.Timestamp] = None,
+                               freq: str = "1min",
+                               rng: Optional[np.random.Generator] = None) -> pd.DataFrame:
+    """
+    Generate a random-walk OHLCV series.
+
+    Closes compound per-bar returns drawn in one shot (no per-bar Python loop);
+    each bar opens at the previous close.
+
+    Args:
+        num_candles: Number of bars
+        preset: Regime from CANDLE_PRESETS supplying the return parameters
+        start_price: Open of the first bar
+        drift: Mean per-bar return (overrides the preset)
+        volatility: Std dev of the per-bar return (overrides the preset)
+        trend_strength: Scale of the extra trend noise component (overrides the preset)
+        chop_strength: Scale of the extra chop noise component (overrides the preset)
+        wick_scale: Max wick length beyond the bar body, in points
+        start: First bar timestamp (default: current UTC minute)
+        freq: Bar spacing
+        rng: Random generator; pass default_rng(seed) for reproducible or
+            per-worker independent series (default: fresh default_rng())
+
+    Returns:
+        DataFrame with Open, High, Low, Close, Volume on a DatetimeIndex
+    """
+    if preset not in CANDLE_PRESETS:
+        raise ValueError(f"Unknown candle preset: {preset!r}")
+    p_drift, p_vol, p_trend, p_chop = CANDLE_PRESETS[preset]
+    drift = p_drift if drift is None else drift
+    volatility = p_vol if volatility is None else volatility
+    trend_strength = p_trend if trend_strength is None else trend_strength
+    chop_strength = p_chop if chop_strength is None else chop_strength
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    returns = (rng.normal(drift, volatility, num_candles)
+               + trend_strength * rng.standard_normal(num_candles)
+               + chop_strength * rng.standard_normal(num_candles))
+
+    # One contiguous OHLCV buffer, filled column by column in place
+    ohlcv = np.empty((num_candles, 5), dtype=np.float64)
+    opens, closes = ohlcv[:, 0], ohlcv[:, 3]
+    np.cumprod(1.0 + returns, out=closes)
+    closes *= start_price
+    if num_candles:
+        opens[0] = start_price
+        opens[1:] = closes[:-1]
+
+    # Upper and lower wicks from a single bulk draw
+    wicks = rng.random((2, num_candles))
+    wicks *= wick_scale
+    np.add(np.maximum(opens, closes), wicks[0], out=ohlcv[:, 1])
+    np.subtract(np.minimum(opens, closes), wicks[1], out=ohlcv[:, 2])
+    ohlcv[:, 4] = rng.integers(100, 1000, num_candles)
+
+    if start is None:
+        start = pd.Timestamp.now(tz="UTC").floor("min")
+    index = pd.date_range(start=start, periods=num_candles, freq=freq)
+
+    return pd.DataFrame(ohlcv, index=index,
+                        columns=["Open", "High", "Low", "Close", "Volume"], copy=False)
@@ -3,6 +3,8 @@ Realistic Trade Simulator
 Simulates MES scalping trades with advanced bracket orders and realistic fills.
 """
 
+import math
+
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta, timezone
@@ -10,6 +12,15 @@ from typing import Dict, Optional, Tuple, List
 from dataclasses import dataclass
 from enum import Enum
 
+from _njit import HAS_NUMBA
+from ._sim_kernel import (
+    walk_long, walk_short, walk_long_plain, walk_short_plain, walk_trades_batch, EXIT_SL, EXIT_TIMEOUT
+)
+
+
+# Compiled bar walk when numba is installed; the per-bar Python path otherwise
+_USE_KERNEL = HAS_NUMBA
+
 
 class ExitReason(Enum):
     """Trade exit reasons."""
@@ -27,6 +38,39 @@ class TradeDirection(Enum):
     SHORT = "short"
 
 
+def _ohlc_matrix(bar_data: pd.DataFrame) -> np.ndarray:
+    """
+    Bars as the kernels' (N, 4) C-contiguous float64 [O, H, L, C] matrix.
+
+    Kept in float64, the same precision as the pure-Python path, so results
+    do not depend on whether numba is installed (bars are not tick-snapped).
+    """
+    return np.ascontiguousarray(bar_data[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64))
+
+
+def _ts_ns(index) -> np.ndarray:
+    """Bar timestamps as int64 ns since epoch (naive index values are taken as UTC)."""
+    return pd.DatetimeIndex(index).as_unit('ns').asi8
+
+
+def _utc(ts: datetime) -> datetime:
+    """Bar timestamp as aware UTC (naive index values are taken as UTC)."""
+    if isinstance(ts, datetime) and ts.tzinfo is None:
+        return ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+# ExitReason by walk_trade exit code (EXIT_TP ... EXIT_MANUAL)
+_EXIT_REASONS = (
+    ExitReason.TAKE_PROFIT,
+    ExitReason.STOP_LOSS,
+    ExitReason.BREAKEVEN,
+    ExitReason.TRAILING_STOP,
+    ExitReason.TIMEOUT,
+    ExitReason.MANUAL,
+)
+
+
 @dataclass
 class TradeResult:
     """Complete trade result with all metrics.
@@ -54,6 +98,83 @@ class TradeResult:
     net_pnl_points: float
 
 
+@dataclass(slots=True)
+class _TradeState:
+    """Mutable per-trade state for the Python bar loop (fixed attribute layout)."""
+    entry_price: float
+    current_sl: float
+    current_tp: float
+    entry_time: datetime
+    sign: float = 1.0              # +1 long / -1 short
+    be_level: float = 0.0
+    trail_start_level: float = 0.0
+    be_moved: bool = False
+    trail_active: bool = False
+    mae: float = 0.0
+    mfe: float = 0.0
+    time_to_be: Optional[int] = None
+    time_to_target: Optional[int] = None
+
+
+@dataclass
+class BatchTradeResults:
+    """
+    Struct-of-arrays results from RealisticSimulator.simulate_trades_batch().
+
+    Row i holds the same metrics as the TradeResult simulate_trade() would
+    return for trade i; times are int64 ns since epoch (UTC) and the *_seconds
+    columns use -1 for "not reached". Use view(i) / to_trade_results() only
+    when per-trade objects are actually needed.
+    """
+    entry_idx: np.ndarray
+    exit_idx: np.ndarray
+    entry_time_ns: np.ndarray
+    exit_time_ns: np.ndarray
+    direction: np.ndarray          # +1 long / -1 short
+    exit_reason: np.ndarray        # walk_trade exit code
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    pnl_points: np.ndarray
+    pnl_dollars: np.ndarray
+    mae: np.ndarray
+    mfe: np.ndarray
+    time_to_target_seconds: np.ndarray
+    time_to_be_seconds: np.ndarray
+    slippage_points: np.ndarray
+    net_pnl_points: np.ndarray
+    commission_paid: float
+
+    def __len__(self) -> int:
+        return len(self.entry_idx)
+
+    def view(self, i: int) -> TradeResult:
+        """Materialize row i as a TradeResult."""
+        ttt = int(self.time_to_target_seconds[i])
+        tbe = int(self.time_to_be_seconds[i])
+        return TradeResult(
+            entry_price=float(self.entry_price[i]),
+            exit_price=float(self.exit_price[i]),
+            entry_time=pd.Timestamp(int(self.entry_time_ns[i]), tz='UTC'),
+            exit_time=pd.Timestamp(int(self.exit_time_ns[i]), tz='UTC'),
+            direction=TradeDirection.LONG if self.direction[i] > 0 else TradeDirection.SHORT,
+            exit_reason=_EXIT_REASONS[self.exit_reason[i]],
+            pnl_points=float(self.pnl_points[i]),
+            pnl_dollars=float(self.pnl_dollars[i]),
+            mae=float(self.mae[i]),
+            mfe=float(self.mfe[i]),
+            time_to_target_seconds=ttt if ttt >= 0 else None,
+            time_to_be_seconds=tbe if tbe >= 0 else None,
+            commission_paid=self.commission_paid,
+            slippage_points=float(self.slippage_points[i]),
+            gross_pnl_points=float(self.pnl_points[i]),
+            net_pnl_points=float(self.net_pnl_points[i])
+        )
+
+    def to_trade_results(self) -> List[TradeResult]:
+        """Materialize every row as a TradeResult."""
+        return [self.view(i) for i in range(len(self))]
+
+
 class RealisticSimulator:
     """
     Advanced trade simulator for MES scalping with realistic execution.
@@ -86,6 +207,15 @@ class RealisticSimulator:
         self.trail_start = self.risk_config['trail_after']
         self.trail_distance = self.risk_config['trail_distance']
         self.timeout_minutes = self.risk_config['timeout_minutes']
+        self._timeout_ns = self.timeout_minutes * 60 * 1_000_000_000
+
+        # Breakeven (and so trailing, which only arms after BE) can be disabled
+        # with null / inf; a plain bracket then skips that state machine entirely
+        self._has_be = self.be_threshold is not None and math.isfinite(self.be_threshold)
+        if not self._has_be:
+            self.be_threshold = math.inf
+        if self.trail_start is None:
+            self.trail_start = math.inf
 
         # Market parameters
         self.tick_size = self.market_config['tick_size']
@@ -122,64 +252,211 @@ class RealisticSimulator:
         # Calculate brackets from the ACTUAL filled price (fix)
         brackets = self._calculate_brackets(slipped_entry, direction)
 
+        if _USE_KERNEL and not bar_data.empty:
+            return self._simulate_trade_kernel(slipped_entry, brackets, entry_time, direction, bar_data)
+
         # Track trade state
-        trade_state = {
-            'entry_price': slipped_entry,
-            'current_sl': brackets['initial_sl'],
-            'current_tp': brackets['tp'],
-            'be_moved': False,
-            'trail_active': False,
-            'mae': 0.0,
-            'mfe': 0.0,
-            'time_to_be': None,
-            'time_to_target': None,
-            'entry_time': entry_time,  # store for result assembly (fix)
-        }
+        trade_state = _TradeState(
+            entry_price=slipped_entry,
+            current_sl=brackets['initial_sl'],
+            current_tp=brackets['tp'],
+            entry_time=entry_time,  # store for result assembly (fix)
+            sign=1.0 if direction == TradeDirection.LONG else -1.0,
+            be_level=brackets['be_level'],
+            trail_start_level=brackets['trail_start_level'],
+        )
+
+        # Raw OHLC rows and int64 ns timestamps (no per-bar Series / datetime math)
+        ohlc_arr = bar_data[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64)
+        ohlc = ohlc_arr.tolist()
+        timestamps = bar_data.index
+        ts_ns = _ts_ns(timestamps)
+        entry_ns = pd.Timestamp(entry_time).value
+
+        # Skip (vectorized) the leading bars where nothing but MAE/MFE can change
+        start = self._first_event_bar(ohlc_arr, ts_ns, entry_ns, trade_state)
 
         # Iterate bars
-        for i, (timestamp, bar) in enumerate(bar_data.iterrows()):
-            # Ensure timestamp is aware UTC for math
-            if isinstance(timestamp, datetime) and timestamp.tzinfo is None:
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
+        ts_list = ts_ns.tolist()
+        for i in range(start, len(ohlc)):
+            o, h, l, c = ohlc[i]
+            elapsed_ns = ts_list[i] - entry_ns
 
             # Check timeout BEFORE processing the bar
-            if self._is_timeout(entry_time, timestamp):
+            if self._is_timeout(elapsed_ns):
                 # Exit at current bar's CLOSE (fix: not at original entry)
-                exit_px = float(bar['Close']) if 'Close' in bar else trade_state['entry_price']
                 return self._create_trade_result(
-                    trade_state, entry_time, timestamp, exit_px, ExitReason.TIMEOUT, direction
+                    trade_state, entry_time, _utc(timestamps[i]), c, ExitReason.TIMEOUT, direction
                 )
 
             # Process the bar
-            exit_result = self._process_bar(bar, trade_state, direction, timestamp, entry_time)
-            if exit_result:
-                return exit_result
+            exit_fill = self._process_bar(o, h, l, c, trade_state, elapsed_ns)
+            if exit_fill:
+                exit_px, exit_reason = exit_fill
+                return self._create_trade_result(
+                    trade_state, entry_time, _utc(timestamps[i]), exit_px, exit_reason, direction
+                )
 
         # Force close at last known close if still open
-        last_bar = bar_data.iloc[-1]
-        last_ts = bar_data.index[-1]
-        if isinstance(last_ts, datetime) and last_ts.tzinfo is None:
-            last_ts = last_ts.replace(tzinfo=timezone.utc)
-        last_price = float(last_bar['Close'])
-
         return self._create_trade_result(
-            trade_state, entry_time, last_ts, last_price, ExitReason.MANUAL, direction
+            trade_state, entry_time, _utc(timestamps[-1]), ohlc[-1][3], ExitReason.MANUAL, direction
         )
 
-    def _calculate_brackets(self, fill_price: float, direction: TradeDirection) -> Dict[str, float]:
-        """Calculate initial bracket order levels from the actual fill price."""
+    def simulate_trades_batch(self,
+                              entry_idx: np.ndarray,
+                              entry_prices: np.ndarray,
+                              directions: np.ndarray,
+                              bar_data: pd.DataFrame) -> BatchTradeResults:
+        """
+        Simulate many trades over one shared bar frame in a single kernel pass.
+
+        Trade i enters at bar entry_idx[i] (entry time = that bar's timestamp)
+        and follows the same rules as simulate_trade().
+
+        Args:
+            entry_idx: Entry bar position per trade (int)
+            entry_prices: Intended entry price per trade
+            directions: +1 for long / -1 for short per trade
+            bar_data: OHLCV data shared by all trades
+
+        Returns:
+            BatchTradeResults with one row per trade
+        """
+        ohlc = _ohlc_matrix(bar_data)
+        ts_ns = _ts_ns(bar_data.index)
+        return self._simulate_trades_arrays(ohlc, ts_ns, entry_idx, entry_prices, directions)
+
+    def _simulate_trades_arrays(self, ohlc: np.ndarray, ts_ns: np.ndarray, entry_idx: np.ndarray,
+                                entry_prices: np.ndarray, directions: np.ndarray) -> BatchTradeResults:
+        """simulate_trades_batch() on a raw (N, 4) float64 OHLC matrix and int64 ns timestamps."""
+        entry_idx = np.asarray(entry_idx, dtype=np.int64)
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        sign = np.where(np.asarray(directions) > 0, 1, -1).astype(np.int64)
+        if len(entry_idx) and (entry_idx.min() < 0 or entry_idx.max() >= len(ohlc)):
+            raise IndexError("entry_idx out of range for bar_data")
+
+        # Entry slippage (wider on wide first bars), applied against the trade
+        slip = np.full(len(entry_idx), self.base_slippage_ticks * self.tick_size)
+        spread = ohlc[entry_idx, 1] - ohlc[entry_idx, 2]
+        slip[spread > 2.0] *= 1.5
+        slipped_entry = entry_prices + sign * slip
+
+        # Brackets from the filled price
+        tp = slipped_entry + sign * self.tp_points
+        sl = slipped_entry - sign * self.sl_points
+
+        exit_idx, exit_price, reason, mae, mfe, time_to_be, time_to_target = walk_trades_batch(
+            ohlc, ts_ns, entry_idx, slipped_entry, sign, tp, sl,
+            float(self.be_threshold), float(self.trail_start), float(self.trail_distance),
+            float(self.timeout_minutes)
+        )
+
+        # Market-order exits (stops / timeout) pay exit slippage
+        exit_slip = np.where((reason >= EXIT_SL) & (reason <= EXIT_TIMEOUT),
+                             self.base_slippage_ticks * self.tick_size, 0.0)
+        exit_price = exit_price - sign * exit_slip
+        gross = sign * (exit_price - slipped_entry)
+
+        return BatchTradeResults(
+            entry_idx=entry_idx,
+            exit_idx=exit_idx,
+            entry_time_ns=ts_ns[entry_idx],
+            exit_time_ns=ts_ns[exit_idx],
+            direction=sign,
+            exit_reason=reason,
+            entry_price=slipped_entry,
+            exit_price=exit_price,
+            pnl_points=gross,
+            pnl_dollars=gross * self.contract_size - self.commission_per_trade,
+            mae=mae,
+            mfe=mfe,
+            time_to_target_seconds=time_to_target,
+            time_to_be_seconds=time_to_be,
+            slippage_points=self.base_slippage_ticks * self.tick_size + exit_slip,
+            net_pnl_points=gross - self.commission_per_trade / self.contract_size,
+            commission_paid=self.commission_per_trade
+        )
+
+    def _simulate_trade_kernel(self, slipped_entry: float, brackets: Dict[str, float],
+                               entry_time: datetime, direction: TradeDirection,
+                               bar_data: pd.DataFrame) -> TradeResult:
+        """simulate_trade() via the compiled walk_long / walk_short kernels over raw arrays."""
+        ohlc = _ohlc_matrix(bar_data)
+        ts_ns = _ts_ns(bar_data.index)
+        entry_ts_ns = pd.Timestamp(entry_time).value
+
+        # Direction and management are fixed for the trade: pick the specialized walk once
         if direction == TradeDirection.LONG:
-            tp = fill_price + self.tp_points
-            initial_sl = fill_price - self.sl_points
+            walk = walk_long if self._has_be else walk_long_plain
         else:
-            tp = fill_price - self.tp_points
-            initial_sl = fill_price + self.sl_points
+            walk = walk_short if self._has_be else walk_short_plain
+        exit_idx, exit_price, reason_code, mae, mfe, time_to_be, time_to_target = walk(
+            ohlc, ts_ns, entry_ts_ns, slipped_entry,
+            brackets['tp'], brackets['initial_sl'],
+            float(self.be_threshold), float(self.trail_start), float(self.trail_distance),
+            float(self.timeout_minutes)
+        )
 
+        exit_time = _utc(bar_data.index[exit_idx])
+
+        trade_state = _TradeState(
+            entry_price=slipped_entry,
+            current_sl=brackets['initial_sl'],
+            current_tp=brackets['tp'],
+            entry_time=entry_time,
+            mae=float(mae),
+            mfe=float(mfe),
+            time_to_be=int(time_to_be) if time_to_be >= 0 else None,
+            time_to_target=int(time_to_target) if time_to_target >= 0 else None,
+        )
+        return self._create_trade_result(
+            trade_state, entry_time, exit_time, float(exit_price), _EXIT_REASONS[reason_code], direction
+        )
+
+    def _first_event_bar(self, ohlc: np.ndarray, ts_ns: np.ndarray, entry_ns: int,
+                         trade_state: _TradeState) -> int:
+        """
+        Index of the first bar that can time out, move the stop to BE, or touch the
+        initial stop/target; folds MAE/MFE over the bars before it into trade_state.
+
+        Until then the stop is static and no exit is possible, so only the running
+        extremes change. A plain bracket that resolves before BE never loops per bar.
+        """
+        n = len(ohlc)
+        if n == 0:
+            return 0
+        sign = trade_state.sign
+        if sign > 0:
+            fav, adv = ohlc[:, 1], ohlc[:, 2]
+        else:
+            fav, adv = ohlc[:, 2], ohlc[:, 1]
+
+        event = ts_ns - entry_ns >= self._timeout_ns
+        if self._has_be:
+            event |= sign * (fav - trade_state.be_level) >= 0
+        event |= sign * (fav - trade_state.current_tp) >= 0
+        event |= sign * (adv - trade_state.current_sl) <= 0
+        k = int(np.argmax(event)) if event.any() else n
+
+        if k:
+            entry_price = trade_state.entry_price
+            # fmax.reduce skips NaN bars like the scalar running max does
+            mfe = float(np.fmax.reduce(sign * (fav[:k] - entry_price)))
+            mae = float(np.fmax.reduce(sign * (entry_price - adv[:k])))
+            if mfe > trade_state.mfe:
+                trade_state.mfe = mfe
+            if mae > trade_state.mae:
+                trade_state.mae = mae
+        return k
+
+    def _calculate_brackets(self, fill_price: float, direction: TradeDirection) -> Dict[str, float]:
+        """Calculate initial bracket order levels from the actual fill price."""
+        sign = 1.0 if direction == TradeDirection.LONG else -1.0
         return {
-            'tp': tp,
-            'initial_sl': initial_sl,
-            'be_level': fill_price + (self.be_threshold if direction == TradeDirection.LONG else -self.be_threshold),
-            'trail_start_level': fill_price + (self.trail_start if direction == TradeDirection.LONG else -self.trail_start)
+            'tp': fill_price + sign * self.tp_points,
+            'initial_sl': fill_price - sign * self.sl_points,
+            'be_level': fill_price + sign * self.be_threshold,
+            'trail_start_level': fill_price + sign * self.trail_start
         }
 
     def _apply_entry_slippage(self, entry_price: float, direction: TradeDirection, first_bar: Optional[pd.Series]) -> float:
@@ -193,154 +470,111 @@ class RealisticSimulator:
                 base_slippage *= 1.5
 
         # Apply in unfavorable direction
-        if direction == TradeDirection.LONG:
-            return entry_price + base_slippage
+        sign = 1.0 if direction == TradeDirection.LONG else -1.0
+        return entry_price + sign * base_slippage
+
+    def _process_bar(self, o: float, h: float, l: float, c: float, trade_state: _TradeState,
+                     elapsed_ns: int) -> Optional[Tuple[float, ExitReason]]:
+        """Process a single bar for trade management; returns (exit price, reason) on exit."""
+        # Favorable / adverse extremes for the trade direction
+        if trade_state.sign > 0:
+            fav, adv = h, l
         else:
-            return entry_price - base_slippage
+            fav, adv = l, h
 
-    def _process_bar(self, bar: pd.Series, trade_state: Dict, direction: TradeDirection,
-                     timestamp: datetime, entry_time: datetime) -> Optional[TradeResult]:
-        """Process a single bar for trade management."""
         # Update MAE/MFE
-        self._update_mae_mfe(bar, trade_state, direction)
+        self._update_mae_mfe(fav, adv, trade_state)
 
         # Check for breakeven move
-        if not trade_state['be_moved']:
-            be_hit = self._check_breakeven(bar, trade_state, direction)
+        if self._has_be and not trade_state.be_moved:
+            be_hit = self._check_breakeven(fav, trade_state)
             if be_hit:
-                trade_state['time_to_be'] = int((timestamp - entry_time).total_seconds())
+                trade_state.time_to_be = int(elapsed_ns / 1e9)
 
         # Check for trailing activation
-        if not trade_state['trail_active'] and trade_state['be_moved']:
-            self._check_trailing_activation(bar, trade_state, direction)
+        if not trade_state.trail_active and trade_state.be_moved:
+            self._check_trailing_activation(fav, trade_state)
 
         # Update trailing stop if active
-        if trade_state['trail_active']:
-            self._update_trailing_stop(bar, trade_state, direction)
+        if trade_state.trail_active:
+            self._update_trailing_stop(fav, trade_state)
 
         # Simulate intrabar execution using OHLC
-        return self._simulate_intrabar_execution(bar, trade_state, direction, timestamp, entry_time)
+        return self._simulate_intrabar_execution(o, h, l, c, trade_state, elapsed_ns)
 
-    def _update_mae_mfe(self, bar: pd.Series, trade_state: Dict, direction: TradeDirection):
+    def _update_mae_mfe(self, fav: float, adv: float, trade_state: _TradeState):
         """Update Maximum Adverse/Favorable Excursion."""
-        entry_price = trade_state['entry_price']
-        high = float(bar['High'])
-        low = float(bar['Low'])
-
-        if direction == TradeDirection.LONG:
-            current_mfe = high - entry_price
-            current_mae = entry_price - low
-        else:
-            current_mfe = entry_price - low
-            current_mae = high - entry_price
-
-        trade_state['mfe'] = max(trade_state['mfe'], current_mfe)
-        trade_state['mae'] = max(trade_state['mae'], current_mae)
-
-    def _check_breakeven(self, bar: pd.Series, trade_state: Dict, direction: TradeDirection) -> bool:
+        sign = trade_state.sign
+        entry_price = trade_state.entry_price
+        current_mfe = sign * (fav - entry_price)
+        current_mae = sign * (entry_price - adv)
+
+        # Two-operand running max without builtin max()'s varargs call
+        if current_mfe > trade_state.mfe:
+            trade_state.mfe = current_mfe
+        if current_mae > trade_state.mae:
+            trade_state.mae = current_mae
+
+    def _check_breakeven(self, fav: float, trade_state: _TradeState) -> bool:
         """Check if breakeven threshold is hit and move stop."""
-        entry_price = trade_state['entry_price']
-        high = float(bar['High'])
-        low = float(bar['Low'])
-
-        if direction == TradeDirection.LONG:
-            if high >= entry_price + self.be_threshold:
-                trade_state['current_sl'] = entry_price
-                trade_state['be_moved'] = True
-                return True
-        else:
-            if low <= entry_price - self.be_threshold:
-                trade_state['current_sl'] = entry_price
-                trade_state['be_moved'] = True
-                return True
-
+        if trade_state.sign * (fav - trade_state.be_level) >= 0:
+            trade_state.current_sl = trade_state.entry_price
+            trade_state.be_moved = True
+            return True
         return False
 
-    def _check_trailing_activation(self, bar: pd.Series, trade_state: Dict, direction: TradeDirection):
+    def _check_trailing_activation(self, fav: float, trade_state: _TradeState):
         """Check if trailing stop should be activated."""
-        entry_price = trade_state['entry_price']
-        high = float(bar['High'])
-        low = float(bar['Low'])
-
-        if direction == TradeDirection.LONG:
-            if high >= entry_price + self.trail_start:
-                trade_state['trail_active'] = True
-        else:
-            if low <= entry_price - self.trail_start:
-                trade_state['trail_active'] = True
-
-    def _update_trailing_stop(self, bar: pd.Series, trade_state: Dict, direction: TradeDirection):
-        """Update trailing stop level."""
-        high = float(bar['High'])
-        low = float(bar['Low'])
-        if direction == TradeDirection.LONG:
-            new_stop = high - self.trail_distance
-            trade_state['current_sl'] = max(trade_state['current_sl'], new_stop)
-        else:
-            new_stop = low + self.trail_distance
-            trade_state['current_sl'] = min(trade_state['current_sl'], new_stop)
-
-    def _simulate_intrabar_execution(self, bar: pd.Series, trade_state: Dict, direction: TradeDirection,
-                                     timestamp: datetime, entry_time: datetime) -> Optional[TradeResult]:
-        """Simulate realistic order execution within the bar."""
-        o = float(bar['Open'])
-        h = float(bar['High'])
-        l = float(bar['Low'])
-        c = float(bar['Close'])
-
-        # Order of price action simulation: Open -> High/Low -> Close
-        prices = [o]
-        if h != o and l != o:
-            prices.extend([l, h] if c > o else [h, l])
-        elif h != o:
-            prices.append(h)
-        elif l != o:
-            prices.append(l)
-        prices.append(c)
-
-        for price in prices:
+        if trade_state.sign * (fav - trade_state.trail_start_level) >= 0:
+            trade_state.trail_active = True
+
+    def _update_trailing_stop(self, fav: float, trade_state: _TradeState):
+        """Update trailing stop level (only ever tightens)."""
+        sign = trade_state.sign
+        new_stop = fav - sign * self.trail_distance
+        if sign * (new_stop - trade_state.current_sl) > 0:
+            trade_state.current_sl = new_stop
+
+    def _simulate_intrabar_execution(self, o: float, h: float, l: float, c: float, trade_state: _TradeState,
+                                     elapsed_ns: int) -> Optional[Tuple[float, ExitReason]]:
+        """Simulate realistic order execution within the bar; returns (exit price, reason) on exit."""
+        # Order of price action simulation: Open -> High/Low -> Close. A wick equal
+        # to the open just re-checks the open price with unchanged state (no-op).
+        sign = trade_state.sign
+        for price in ((o, l, h, c) if c > o else (o, h, l, c)):
             # Stop loss / BE / trailing
-            if self._is_stop_hit(price, trade_state['current_sl'], direction):
-                exit_reason = ExitReason.TRAILING_STOP if trade_state['trail_active'] else (
-                    ExitReason.BREAKEVEN if trade_state['be_moved'] else ExitReason.STOP_LOSS
-                )
-                return self._create_trade_result(
-                    trade_state, entry_time, timestamp, trade_state['current_sl'], exit_reason, direction
+            if self._is_stop_hit(price, trade_state.current_sl, sign):
+                exit_reason = ExitReason.TRAILING_STOP if trade_state.trail_active else (
+                    ExitReason.BREAKEVEN if trade_state.be_moved else ExitReason.STOP_LOSS
                 )
+                return trade_state.current_sl, exit_reason
 
             # Take profit
-            if self._is_target_hit(price, trade_state['current_tp'], direction):
-                if trade_state['time_to_target'] is None:
-                    trade_state['time_to_target'] = int((timestamp - entry_time).total_seconds())
-                return self._create_trade_result(
-                    trade_state, entry_time, timestamp, trade_state['current_tp'], ExitReason.TAKE_PROFIT, direction
-                )
+            if self._is_target_hit(price, trade_state.current_tp, sign):
+                if trade_state.time_to_target is None:
+                    trade_state.time_to_target = int(elapsed_ns / 1e9)
+                return trade_state.current_tp, ExitReason.TAKE_PROFIT
 
         return None
 
-    def _is_stop_hit(self, current_price: float, stop_price: float, direction: TradeDirection) -> bool:
-        """Check if stop loss is hit."""
-        if direction == TradeDirection.LONG:
-            return current_price <= stop_price
-        else:
-            return current_price >= stop_price
+    @staticmethod
+    def _is_stop_hit(current_price: float, stop_price: float, sign: float) -> bool:
+        """Check if stop loss is hit (sign: +1 long / -1 short)."""
+        return sign * (current_price - stop_price) <= 0
 
-    def _is_target_hit(self, current_price: float, target_price: float, direction: TradeDirection) -> bool:
-        """Check if take profit is hit."""
-        if direction == TradeDirection.LONG:
-            return current_price >= target_price
-        else:
-            return current_price <= target_price
+    @staticmethod
+    def _is_target_hit(current_price: float, target_price: float, sign: float) -> bool:
+        """Check if take profit is hit (sign: +1 long / -1 short)."""
+        return sign * (current_price - target_price) >= 0
 
-    def _is_timeout(self, entry_time: datetime, current_time: datetime) -> bool:
-        """Check if trade has timed out."""
-        time_elapsed = (current_time - entry_time).total_seconds() / 60
-        return time_elapsed >= self.timeout_minutes
+    def _is_timeout(self, elapsed_ns: int) -> bool:
+        """Check if trade has timed out (elapsed since entry in ns)."""
+        return elapsed_ns >= self._timeout_ns
 
-    def _create_trade_result(self, trade_state: Dict, entry_time: datetime, exit_time: datetime,
+    def _create_trade_result(self, trade_state: _TradeState, entry_time: datetime, exit_time: datetime,
                              exit_price: float, exit_reason: ExitReason, direction: TradeDirection) -> TradeResult:
         """Create final trade result with all metrics."""
-        entry_price = trade_state['entry_price']
+        entry_price = trade_state.entry_price
 
         # Gross P&L (slippage applied below)
         if direction == TradeDirection.LONG:
@@ -382,10 +616,10 @@ class RealisticSimulator:
             exit_reason=exit_reason,
             pnl_points=gross_pnl_points,          # gross points
             pnl_dollars=net_pnl_dollars,          # NET dollars (kept for backward compat)
-            mae=trade_state['mae'],
-            mfe=trade_state['mfe'],
-            time_to_target_seconds=trade_state.get('time_to_target'),
-            time_to_be_seconds=trade_state.get('time_to_be'),
+            mae=trade_state.mae,
+            mfe=trade_state.mfe,
+            time_to_target_seconds=trade_state.time_to_target,
+            time_to_be_seconds=trade_state.time_to_be,
             commission_paid=self.commission_per_trade,
             slippage_points=total_slippage,
             gross_pnl_points=gross_pnl_points,
@@ -0,0 +1,99 @@
+"""
+Config Sweep
+Runs simulate_trades_batch for many simulator configs (e.g. A/B presets) in a
+process pool, with the bar arrays placed once in shared memory.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .realistic_sim import RealisticSimulator, BatchTradeResults, _ohlc_matrix, _ts_ns
+
+
+def _attach(name: str, shape: Tuple[int, ...], dtype: str) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Map an existing shared-memory block as a read-only ndarray."""
+    shm = shared_memory.SharedMemory(name=name)
+    arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    arr.flags.writeable = False
+    return shm, arr
+
+
+def _run_config(config: Dict, ohlc_spec: Tuple, ts_spec: Tuple, entry_idx: np.ndarray,
+                entry_prices: np.ndarray, directions: np.ndarray) -> BatchTradeResults:
+    """Worker: simulate every entry for one config against the shared bars."""
+    ohlc_shm, ohlc = _attach(*ohlc_spec)
+    ts_shm, ts_ns = _attach(*ts_spec)
+    try:
+        return RealisticSimulator(config)._simulate_trades_arrays(
+            ohlc, ts_ns, entry_idx, entry_prices, directions
+        )
+    finally:
+        del ohlc, ts_ns
+        ohlc_shm.close()
+        ts_shm.close()
+
+
+def _share(arr: np.ndarray) -> Tuple[shared_memory.SharedMemory, Tuple]:
+    """Copy an array into a new shared-memory block; returns (block, attach spec)."""
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def sweep_configs(configs: List[Dict],
+                  entry_idx: np.ndarray,
+                  entry_prices: np.ndarray,
+                  directions: np.ndarray,
+                  bar_data: pd.DataFrame,
+                  max_workers: Optional[int] = None) -> Iterator[Tuple[int, BatchTradeResults]]:
+    """
+    Simulate the same entries under each config, one process-pool job per config.
+
+    The OHLC and timestamp arrays are written to shared memory once and mapped
+    read-only by the workers, so the bar frame is never pickled per job.
+    Results are yielded as soon as each job finishes, for incremental streaming.
+
+    Args:
+        configs: Simulator configs (see RealisticSimulator)
+        entry_idx, entry_prices, directions: Trades, as for simulate_trades_batch()
+        bar_data: OHLCV data shared by all trades
+        max_workers: Pool size (default: os.cpu_count(), capped at len(configs))
+
+    Yields:
+        (config index, BatchTradeResults) in completion order
+    """
+    if not configs:
+        return
+
+    ohlc = _ohlc_matrix(bar_data)
+    ts_ns = _ts_ns(bar_data.index)
+    entry_idx = np.asarray(entry_idx, dtype=np.int64)
+    entry_prices = np.asarray(entry_prices, dtype=np.float64)
+    directions = np.asarray(directions)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(configs))
+    ohlc_shm, ohlc_spec = _share(ohlc)
+    ts_shm = None
+    try:
+        ts_shm, ts_spec = _share(ts_ns)
+        # spawn, not fork: a forked child inherits numba/LLVM runtime state
+        # from the parent and can deadlock in the compiled kernels
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = {
+                pool.submit(_run_config, cfg, ohlc_spec, ts_spec, entry_idx, entry_prices, directions): i
+                for i, cfg in enumerate(configs)
+            }
+            for fut in as_completed(futures):
+                yield futures[fut], fut.result()
+    finally:
+        for shm in (ohlc_shm, ts_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
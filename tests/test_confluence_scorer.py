@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from prefilter import ConfluenceScorer
+
+
+CONFIG = {
+    'prefilter': {
+        'min_score': 75,
+        'weights': {'trend': 25, 'volume': 20, 'structure': 20, 'atr_band': 10,
+                    'session': 10, 'body_cleanliness': 5, 'liquidity': 5, 'news': 5},
+        'thresholds': {'volume_multiple': 1.8, 'orb_volume_multiple': 2.2, 'atr_min': 0.8,
+                       'atr_max': 2.0, 'min_body_ratio': 0.35},
+    },
+}
+
+INDICATORS = {'current_price': 100.0, '1m_EMA_20': 100.6, '1m_VWAP': 150.0}
+
+
+def _bars(closes):
+    closes = np.asarray(closes, dtype=np.float64)
+    return pd.DataFrame({'Open': closes, 'High': closes + 0.25, 'Low': closes - 0.25, 'Close': closes},
+                        index=pd.date_range('2025-01-21 14:30', periods=len(closes), freq='min'))
+
+
+def _structure(scorer, bars):
+    return scorer.calculate_score(INDICATORS, {}, {'1m': bars})['subscores']['structure']
+
+
+def test_structure_sees_revised_earlier_bar():
+    touched = _bars([99.0] * 7 + [100.5, 99.0, 99.0])   # a recent close touches the EMA
+    revised = _bars([99.0] * 10)                        # same window, same last close
+
+    scorer = ConfluenceScorer(CONFIG)
+    assert _structure(scorer, touched) == 90.0          # 20EMA pullback
+    assert _structure(scorer, revised) == _structure(ConfluenceScorer(CONFIG), revised) == 0.0
+
+
+def test_scores_batch_empty():
+    scorer = ConfluenceScorer(CONFIG)
+    out = scorer.calculate_scores_batch(pd.DataFrame(columns=['current_price']), np.empty((0, 20, 4)))
+    assert len(out) == 0
+    assert list(out.columns) == ['total_score', *scorer._factor_order, 'passing']
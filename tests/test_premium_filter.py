@@ -0,0 +1,75 @@
+import dataclasses
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from prefilter import PremiumFilter, SessionValidator
+
+
+CONFIG = {
+    'meta': {'timezone': 'America/Chicago'},
+    'sessions': {'rth_a': '08:30-10:30', 'rth_b': '13:00-15:00', 'block_lunch': '10:30-13:00'},
+    'prefilter': {'min_score': 60},
+}
+
+
+class StubScorer:
+    """score(...) -> (score, factors), the contract PremiumFilter calls."""
+
+    def score(self, setup_type, direction, ema_alignment, volume_multiple, atr_5m,
+              vwap_distance, wickiness, trend_strength, extras):
+        factors = [name for name, on in (('trend', trend_strength > 0.5),
+                                         ('volume', volume_multiple > 1.5),
+                                         ('clean_body', wickiness < 0.3)) if on]
+        return 50.0 + 20.0 * trend_strength - 5.0 * wickiness, factors
+
+
+def _raw(rng, i):
+    return {
+        'symbol': 'MES=F',
+        'setup_type': 'EMA_PULLBACK',
+        'direction': 'long' if i % 2 else 'short',
+        'regime': 'bull',
+        # Every 7 minutes across a day, so some fall outside the sessions
+        'timestamp': datetime(2025, 1, 21, 12, tzinfo=timezone.utc) + timedelta(minutes=7 * i),
+        'indicators': {
+            'ema_alignment': ['bullish_aligned', 'bearish_aligned', 'mixed'][i % 3],
+            'volume_multiple': abs(rng.normal(1.6, 0.6)), 'atr_5m': abs(rng.normal(1.2, 0.6)),
+            'vwap_distance': rng.normal(0, 1.5), 'wickiness': rng.random(),
+            'trend_strength': rng.random(),
+            'news_tags': ['CPI'] if i % 11 == 0 else [],
+        },
+    }
+
+
+@pytest.fixture
+def premium_filter():
+    return PremiumFilter(CONFIG, SessionValidator(CONFIG), StubScorer())
+
+
+def test_evaluate_batch_rows_match_evaluate(premium_filter):
+    rng = np.random.default_rng(5)
+    raws = [_raw(rng, i) for i in range(200)]
+
+    batch = premium_filter.evaluate_batch(raws)
+    singles = [premium_filter.evaluate(raw) for raw in raws]
+
+    kept = [i for i, cand in enumerate(singles) if cand is not None]
+    assert 0 < len(kept) < len(raws)
+    assert batch.source_index.tolist() == kept
+    for k, i in enumerate(batch.source_index):
+        assert dataclasses.asdict(batch.view(k)) == dataclasses.asdict(singles[i])
+
+
+def test_evaluate_batch_empty(premium_filter):
+    assert len(premium_filter.evaluate_batch([])) == 0
+
+
+def test_threshold_attributes_rebuild_thresholds(premium_filter):
+    assert premium_filter.min_score == premium_filter.t.min_score == 60.0
+
+    premium_filter.min_score = '55'
+    premium_filter.event_block_tags = ['FOMC']
+    assert premium_filter.t.min_score == 55.0
+    assert premium_filter.t.event_block_tags == frozenset({'FOMC'})
@@ -0,0 +1,57 @@
+import dataclasses
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import simulation.realistic_sim as realistic_sim
+from simulation import RealisticSimulator, TradeDirection, generate_simulated_candles
+
+
+CONFIGS = [
+    {'risk': {'tp': 3.0, 'sl': 2.0, 'move_to_be_at': 1.0, 'trail_after': 2.0,
+              'trail_distance': 1.0, 'timeout_minutes': 15},
+     'market': {'tick_size': 0.25, 'contract_size': 5}},
+    {'risk': {'tp': 2.0, 'sl': 1.5, 'move_to_be_at': None, 'trail_after': None,
+              'trail_distance': 1.0, 'timeout_minutes': 45},
+     'market': {'tick_size': 0.25, 'contract_size': 5}},
+]
+
+
+@pytest.fixture(scope='module')
+def bars():
+    # Random-walk candles are not on the tick grid, which exposes any
+    # precision difference between the kernel and pure-Python paths
+    return generate_simulated_candles(400, start=pd.Timestamp('2025-01-21 15:00'),
+                                      rng=np.random.default_rng(3))
+
+
+def _simulate(monkeypatch, use_kernel, config, bars, entries):
+    monkeypatch.setattr(realistic_sim, '_USE_KERNEL', use_kernel)
+    sim = RealisticSimulator(config)
+    return [dataclasses.asdict(sim.simulate_trade(price, bars.index[i].to_pydatetime(), direction, bars.iloc[i:]))
+            for i, price, direction in entries]
+
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_kernel_matches_python_on_non_tick_bars(monkeypatch, bars, config):
+    rng = np.random.default_rng(4)
+    idx = rng.integers(0, len(bars) - 1, 300)
+    entries = [(int(i), float(bars['Open'].iat[i]),
+                TradeDirection.LONG if rng.random() < 0.5 else TradeDirection.SHORT) for i in idx]
+
+    assert (_simulate(monkeypatch, True, config, bars, entries)
+            == _simulate(monkeypatch, False, config, bars, entries))
+
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_python_fast_forward_matches_full_bar_walk(monkeypatch, bars, config):
+    # _first_event_bar only runs on the pure-Python path (no numba)
+    rng = np.random.default_rng(5)
+    idx = rng.integers(0, len(bars) - 1, 300)
+    entries = [(int(i), float(bars['Open'].iat[i]),
+                TradeDirection.LONG if rng.random() < 0.5 else TradeDirection.SHORT) for i in idx]
+
+    fast = _simulate(monkeypatch, False, config, bars, entries)
+    monkeypatch.setattr(RealisticSimulator, '_first_event_bar', lambda self, *args: 0)
+    assert fast == _simulate(monkeypatch, False, config, bars, entries)
@@ -0,0 +1,47 @@
+import dataclasses
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from simulation import RealisticSimulator, generate_simulated_candles, sweep_configs
+from simulation import _sim_kernel
+from _njit import HAS_NUMBA
+
+
+def _config(tp):
+    return {
+        'risk': {'tp': tp, 'sl': 2.0, 'move_to_be_at': 1.0, 'trail_after': 2.0,
+                 'trail_distance': 1.0, 'timeout_minutes': 15},
+        'market': {'tick_size': 0.25, 'contract_size': 5},
+    }
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")
+def test_kernel_accepts_readonly_bars():
+    ohlc = np.full((5, 4), 100.0, dtype=np.float64)
+    ts_ns = np.arange(5, dtype=np.int64) * 60_000_000_000
+    expected = _sim_kernel.walk_trade(ohlc, ts_ns, 0, 100.0, 1, 101.0, 99.0,
+                                      np.inf, np.inf, 1.0, 15.0)
+    ohlc.flags.writeable = False
+    ts_ns.flags.writeable = False
+    assert _sim_kernel.walk_trade(ohlc, ts_ns, 0, 100.0, 1, 101.0, 99.0,
+                                  np.inf, np.inf, 1.0, 15.0) == expected
+
+
+def test_sweep_matches_batch():
+    bars = generate_simulated_candles(300, start=pd.Timestamp('2025-01-21 15:00'),
+                                      rng=np.random.default_rng(1))
+    rng = np.random.default_rng(2)
+    idx = rng.integers(0, 300, 50)
+    prices = bars['Open'].to_numpy()[idx]
+    directions = rng.choice([1, -1], 50)
+    configs = [_config(tp) for tp in (1.0, 2.0, 3.0)]
+
+    got = dict(sweep_configs(configs, idx, prices, directions, bars, max_workers=2))
+
+    assert sorted(got) == [0, 1, 2]
+    for i, cfg in enumerate(configs):
+        ref = RealisticSimulator(cfg).simulate_trades_batch(idx, prices, directions, bars)
+        assert ([dataclasses.asdict(r) for r in got[i].to_trade_results()]
+                == [dataclasses.asdict(r) for r in ref.to_trade_results()])